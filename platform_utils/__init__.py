@@ -1,7 +1,7 @@
 # platform_utils/__init__.py
 # Platform-specific utilities for Vapor application
 
-from platform_utils.windows import is_admin
+from platform_utils.windows import is_admin, wait_for_process_exit
 from platform_utils.pawnio import (
     is_winget_available,
     is_pawnio_installed,
@@ -15,3 +15,29 @@ def is_admin():
         return ctypes.windll.shell32.IsUserAnAdmin() != 0
     except Exception:
         return False
+
+
+def wait_for_process_exit(pid):
+    """
+    Block until a process exits, waiting on its handle rather than polling.
+
+    Args:
+        pid: ID of the process to wait for
+
+    Returns:
+        bool: True once the process has exited, False if it couldn't be opened
+    """
+    import pywintypes
+    import win32api
+    import win32con
+    import win32event
+
+    try:
+        handle = win32api.OpenProcess(win32con.SYNCHRONIZE, False, pid)
+    except pywintypes.error:
+        return False
+    try:
+        win32event.WaitForSingleObject(handle, win32event.INFINITE)
+    finally:
+        handle.Close()
+    return True
@@ -96,7 +96,8 @@ if '--ui' not in sys.argv and '--elevated' not in sys.argv:
             settings_file = os.path.join(appdata_dir, 'vapor_settings.json')
 
             if os.path.exists(settings_file):
-                with open(settings_file, 'r') as f:
+                # The settings file is always written as UTF-8
+                with open(settings_file, 'r', encoding='utf-8') as f:
                     settings = json.load(f)
                 return settings.get('enable_cpu_thermal', False)
         except Exception:
@@ -444,6 +445,7 @@ def _signal_handler(signum, frame):
     # Signal monitoring thread to stop
     if _stop_event is not None:
         _stop_event.set()
+        wake_update_checker()
 
     # Close any open popup windows
     try:
@@ -473,7 +475,9 @@ def _signal_handler(signum, frame):
     # Brief delay to allow cleanup to complete (matches tray Quit)
     time.sleep(0.5)
 
-    # Force immediate exit - pystray's event loop doesn't always respond to stop()
+    # Force immediate exit - pystray's event loop doesn't always respond to stop().
+    # os._exit skips atexit, so write out any queued log lines first.
+    flush_logs()
     os._exit(0)
 
 
@@ -503,7 +507,7 @@ sys.path.append(application_path)
 # Import shared utilities (logging, constants, paths, settings)
 from utils import (
     base_dir, appdata_dir, SETTINGS_FILE, DEBUG_LOG_FILE,
-    MAX_LOG_SIZE, TRAY_ICON_PATH, PROTECTED_PROCESSES, log,
+    MAX_LOG_SIZE, TRAY_ICON_PATH, is_protected_process, log, flush_logs,
     load_settings as load_settings_dict, save_settings as save_settings_dict,
     create_default_settings as create_default_settings_shared, DEFAULT_SETTINGS,
     GAME_STARTED_SIGNAL_FILE
@@ -518,7 +522,7 @@ from platform_utils import (
 # Additional paths specific to main application
 UI_SCRIPT_PATH = os.path.join(base_dir, 'vapor_settings_ui.py')
 
-from updater import check_for_updates, CURRENT_VERSION, send_telemetry
+from updater import CURRENT_VERSION, send_telemetry, wake_update_checker
 
 
 # =============================================================================
@@ -579,8 +583,11 @@ def set_console_visibility(visible):
 # =============================================================================
 
 def create_default_settings():
-    """Create default settings file on first run. Uses shared settings module."""
-    create_default_settings_shared()
+    """
+    Create default settings file on first run. Uses shared settings module.
+    Returns True if the file was created (i.e. this is the first run).
+    """
+    return create_default_settings_shared()
 
 
 def load_process_names_and_startup():
@@ -717,7 +724,7 @@ def kill_processes(process_names, killed_processes, purpose="", graceful_timeout
 
     for name in process_names:
         # Skip protected system processes
-        if name.lower() in PROTECTED_PROCESSES:
+        if is_protected_process(name):
             log(f"Skipping protected process: {name}", "PROCESS")
             continue
 
@@ -1010,6 +1017,12 @@ class SettingsFileHandler(FileSystemEventHandler):
             log("Settings file changed - triggering reload", "SETTINGS")
             self.callback()
 
+    def on_moved(self, event):
+        # save_settings writes a temp file and renames it over the settings file
+        if event.dest_path.endswith(SETTINGS_FILE):
+            log("Settings file replaced - triggering reload", "SETTINGS")
+            self.callback()
+
 
 # =============================================================================
 # Main Game Monitoring Loop
@@ -1042,29 +1055,26 @@ def monitor_steam_games(stop_event, killed_notification, killed_resource, is_fir
     # Check if we need to reopen settings after an admin restart
     # Also check if CPU thermal is enabled but driver is missing
     pending_settings_reopen = False
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE, 'r') as f:
-                startup_settings = json.load(f)
-            settings_modified = False
-
-            if startup_settings.get('pending_settings_reopen', False):
-                pending_settings_reopen = True
-                startup_settings['pending_settings_reopen'] = False
-                settings_modified = True
-                log("Pending settings reopen flag detected and cleared", "INIT")
-
-            # If CPU thermal is enabled but PawnIO driver is not installed, disable it
-            if startup_settings.get('enable_cpu_thermal', False) and not is_pawnio_installed():
-                log("CPU thermal enabled but PawnIO driver not installed - disabling setting", "INIT")
-                startup_settings['enable_cpu_thermal'] = False
-                settings_modified = True
-
-            if settings_modified:
-                with open(SETTINGS_FILE, 'w') as f:
-                    json.dump(startup_settings, f, indent=4)
-        except Exception as e:
-            log(f"Error checking startup settings: {e}", "ERROR")
+    try:
+        startup_settings = load_settings_dict()
+        settings_modified = False
+
+        if startup_settings.get('pending_settings_reopen', False):
+            pending_settings_reopen = True
+            startup_settings['pending_settings_reopen'] = False
+            settings_modified = True
+            log("Pending settings reopen flag detected and cleared", "INIT")
+
+        # If CPU thermal is enabled but PawnIO driver is not installed, disable it
+        if startup_settings.get('enable_cpu_thermal', False) and not is_pawnio_installed():
+            log("CPU thermal enabled but PawnIO driver not installed - disabling setting", "INIT")
+            startup_settings['enable_cpu_thermal'] = False
+            settings_modified = True
+
+        if settings_modified:
+            save_settings_dict(startup_settings)
+    except Exception as e:
+        log(f"Error checking startup settings: {e}", "ERROR")
 
     # Launch settings on start if enabled, if first run, or if pending reopen
     if is_first_run or launch_settings_on_start or pending_settings_reopen:
@@ -1415,6 +1425,7 @@ def quit_app(icon, query):
     """Shut down Vapor gracefully."""
     log("Quit requested - shutting down...", "SHUTDOWN")
     stop_event.set()
+    wake_update_checker()
 
     # Close any open popup windows to release file handles
     close_all_popups()
@@ -1444,8 +1455,8 @@ def manual_check_updates(icon, query):
     def check_thread():
         try:
             # Use the same proxy and headers as the auto-updater
-            from updater import PROXY_BASE_URL, GITHUB_OWNER, GITHUB_REPO, HEADERS
-            proxy_url = f"{PROXY_BASE_URL}/repos/{GITHUB_OWNER}/{GITHUB_REPO}/releases/latest"
+            from updater import PROXY_BASE_URL, LATEST_RELEASE_PROXY_PATH, HEADERS
+            proxy_url = f"{PROXY_BASE_URL}{LATEST_RELEASE_PROXY_PATH}"
 
             response = requests.get(
                 proxy_url,
@@ -1460,12 +1471,16 @@ def manual_check_updates(icon, query):
             release_data = response.json()
             latest_version = release_data.get("tag_name", "").lstrip('v')
 
-            from updater import compare_versions
-            comparison = compare_versions(latest_version, CURRENT_VERSION)
-
-            if comparison > 0:
-                show_notification(f"Update available: v{latest_version}. Will download automatically.")
-                check_for_updates(get_running_steam_app_id(), show_notification)
+            from updater import is_newer_version
+            if is_newer_version(latest_version):
+                # Let the background update checker fetch it now, bypassing its cache
+                from updater import check_for_updates, request_update_check
+                if request_update_check():
+                    show_notification(f"Update available: v{latest_version}. Will download automatically.")
+                else:
+                    # Checker isn't running (e.g. running from source) - check directly
+                    show_notification(f"Update available: v{latest_version}.")
+                    check_for_updates(get_running_steam_app_id(), show_notification, use_cache=False)
             else:
                 show_notification(f"Vapor is running the latest version (v{CURRENT_VERSION}).")
                 log(f"Already on latest version: v{CURRENT_VERSION}", "UPDATE")
@@ -1519,11 +1534,11 @@ if __name__ == '__main__':
             log(f"sys.argv[0]: {sys.argv[0]}", "INIT")
             log(f"Working dir: {os.getcwd()}", "INIT")
 
-            # Check if this is the first run (no settings file exists)
-            is_first_run = not os.path.exists(SETTINGS_FILE)
+            # Check if this is the first run (no settings file exists) - the shared helper
+            # already checks for the file, so use its result instead of a second stat
+            is_first_run = create_default_settings()
             if is_first_run:
-                log("First run detected - creating default settings file", "INIT")
-                create_default_settings()
+                log("First run detected - created default settings file", "INIT")
 
             # Note: Admin elevation check now happens BEFORE splash screen for faster startup
             # (see "Early Admin Check" section near top of file)
@@ -3,103 +3,74 @@
 # Sets up window, loads settings, builds tabs, handles save/close.
 
 import os
+import re
 import sys
 import ctypes
+import threading
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
-import psutil
 
 from utils import (
-    base_dir, appdata_dir, SETTINGS_FILE, PROTECTED_PROCESSES, log as debug_log,
+    base_dir, appdata_dir, SETTINGS_FILE, is_protected_process, log as debug_log,
     load_settings as load_settings_dict, save_settings as save_settings_dict, set_setting,
-    GAME_STARTED_SIGNAL_FILE
+    update_settings, GAME_STARTED_SIGNAL_FILE
 )
 from platform_utils import (
-    is_admin, is_pawnio_installed, clear_pawnio_cache, install_pawnio_with_elevation
+    is_admin, is_pawnio_installed, clear_pawnio_cache, install_pawnio_with_elevation,
+    wait_for_process_exit
 )
 
 import ui.state as state
 from ui.constants import (
     TAB_NOTIFICATIONS, TAB_RESOURCES, TAB_THERMAL,
     TAB_PREFERENCES, TAB_HELP, TAB_ABOUT,
-    BUILT_IN_APPS, BUILT_IN_RESOURCE_APPS
+    BUILT_IN_APP_PROCESSES, BUILT_IN_RESOURCE_APP_PROCESSES, BUILT_IN_ICON_PATHS,
+    FONT_DESCRIPTION, FONT_SMALL, FONT_LARGE
 )
 from ui.dialogs import show_vapor_dialog, set_dark_title_bar
 from ui.restart import restart_vapor
+from ui.widgets import prefetch_icons
 from ui.tabs import (
     build_notifications_tab, build_resources_tab, build_thermal_tab,
-    build_preferences_tab, build_help_tab, build_about_tab
+    build_preferences_tab, build_help_tab, build_about_tab, start_temperature_display
 )
 
-try:
-    from updater import CURRENT_VERSION
-except ImportError:
-    CURRENT_VERSION = "Unknown"
-
-
-def save_settings_to_file(selected_notification_apps, customs, selected_resource_apps, resource_customs,
-                          launch_startup, launch_settings_on_start, close_on_startup, close_on_hotkey,
-                          relaunch_on_exit, resource_close_on_startup, resource_close_on_hotkey,
-                          resource_relaunch_on_exit, enable_playtime_summary, playtime_summary_mode,
-                          enable_debug_mode, enable_telemetry, system_audio_level, enable_system_audio,
-                          game_audio_level, enable_game_audio, enable_during_power, during_power_plan,
-                          enable_after_power, after_power_plan, enable_game_mode_start, enable_game_mode_end,
-                          enable_cpu_thermal, enable_gpu_thermal, enable_cpu_temp_alert,
-                          cpu_temp_warning_threshold, cpu_temp_critical_threshold, enable_gpu_temp_alert,
-                          gpu_temp_warning_threshold, gpu_temp_critical_threshold):
-    """Save all settings to the JSON configuration file."""
+# Separator for the comma-separated custom process entries, absorbing surrounding whitespace
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
+def save_settings_to_file(settings):
+    """
+    Save all settings to the JSON configuration file.
+
+    Args:
+        settings: Dict of setting values collected from the UI. The notification and
+                  resource process lists are derived here from the selected apps and
+                  custom process entries.
+    """
     # Build process lists from selected apps
-    notification_processes = []
-    for app in BUILT_IN_APPS:
-        if app['display_name'] in selected_notification_apps:
-            notification_processes.extend(app['processes'])
-    notification_processes.extend(customs)
-
-    resource_processes = []
-    for app in BUILT_IN_RESOURCE_APPS:
-        if app['display_name'] in selected_resource_apps:
-            resource_processes.extend(app['processes'])
-    resource_processes.extend(resource_customs)
+    notification_processes = [process for name in settings['selected_notification_apps']
+                              for process in BUILT_IN_APP_PROCESSES.get(name, ())]
+    notification_processes.extend(settings['custom_processes'])
+
+    resource_processes = [process for name in settings['selected_resource_apps']
+                          for process in BUILT_IN_RESOURCE_APP_PROCESSES.get(name, ())]
+    resource_processes.extend(settings['custom_resource_processes'])
 
     settings = {
         'notification_processes': notification_processes,
-        'selected_notification_apps': selected_notification_apps,
-        'custom_processes': customs,
+        'selected_notification_apps': settings['selected_notification_apps'],
+        'custom_processes': settings['custom_processes'],
         'resource_processes': resource_processes,
-        'selected_resource_apps': selected_resource_apps,
-        'custom_resource_processes': resource_customs,
-        'launch_at_startup': launch_startup,
-        'launch_settings_on_start': launch_settings_on_start,
-        'close_on_startup': close_on_startup,
-        'close_on_hotkey': close_on_hotkey,
-        'relaunch_on_exit': relaunch_on_exit,
-        'resource_close_on_startup': resource_close_on_startup,
-        'resource_close_on_hotkey': resource_close_on_hotkey,
-        'resource_relaunch_on_exit': resource_relaunch_on_exit,
-        'enable_playtime_summary': enable_playtime_summary,
-        'playtime_summary_mode': playtime_summary_mode,
-        'enable_debug_mode': enable_debug_mode,
-        'enable_telemetry': enable_telemetry,
-        'system_audio_level': system_audio_level,
-        'enable_system_audio': enable_system_audio,
-        'game_audio_level': game_audio_level,
-        'enable_game_audio': enable_game_audio,
-        'enable_during_power': enable_during_power,
-        'during_power_plan': during_power_plan,
-        'enable_after_power': enable_after_power,
-        'after_power_plan': after_power_plan,
-        'enable_game_mode_start': enable_game_mode_start,
-        'enable_game_mode_end': enable_game_mode_end,
-        'enable_cpu_thermal': enable_cpu_thermal,
-        'enable_gpu_thermal': enable_gpu_thermal,
-        'enable_cpu_temp_alert': enable_cpu_temp_alert,
-        'cpu_temp_warning_threshold': cpu_temp_warning_threshold,
-        'cpu_temp_critical_threshold': cpu_temp_critical_threshold,
-        'enable_gpu_temp_alert': enable_gpu_temp_alert,
-        'gpu_temp_warning_threshold': gpu_temp_warning_threshold,
-        'gpu_temp_critical_threshold': gpu_temp_critical_threshold
+        **settings,
     }
+
+    # Nothing to write if the file already holds these values (it may carry extra keys)
+    current = load_settings_dict()
+    if all(current.get(key) == value for key, value in settings.items()):
+        debug_log("Settings unchanged - skipping write", "Settings")
+        return
     save_settings_dict(settings)
 
 
@@ -109,34 +80,89 @@ def set_pending_pawnio_check(value=True):
     set_setting('pending_pawnio_check', value)
 
 
-def set_pending_settings_reopen(value=True):
-    """Set or clear the pending settings reopen flag."""
-    debug_log(f"Setting pending_settings_reopen to {value}", "Settings")
-    set_setting('pending_settings_reopen', value)
+def set_pending_admin_restart(value=True):
+    """Set or clear both pending PawnIO check and settings reopen flags in one write."""
+    debug_log(f"Setting pending_pawnio_check and pending_settings_reopen to {value}", "Settings")
+    update_settings({'pending_pawnio_check': value, 'pending_settings_reopen': value})
+
+
+# Tab name -> builder to run the first time that tab is selected
+_pending_tab_builds = {}
+
+
+def build_pending_tab(tab_name):
+    """Build a lazily created tab's content the first time it is selected."""
+    builder = _pending_tab_builds.pop(tab_name, None)
+    if builder:
+        debug_log(f"Building tab on first use: {tab_name.strip()}", "Settings")
+        builder()
+
+
+# Settings key -> name of the ui.state Tk variable holding its value, read by on_save
+_SETTING_VARS = (
+    ('launch_at_startup', 'startup_var'),
+    ('launch_settings_on_start', 'launch_settings_on_start_var'),
+    ('close_on_startup', 'close_startup_var'),
+    ('close_on_hotkey', 'close_hotkey_var'),
+    ('relaunch_on_exit', 'relaunch_exit_var'),
+    ('resource_close_on_startup', 'resource_close_startup_var'),
+    ('resource_close_on_hotkey', 'resource_close_hotkey_var'),
+    ('resource_relaunch_on_exit', 'resource_relaunch_exit_var'),
+    ('enable_playtime_summary', 'playtime_summary_var'),
+    ('playtime_summary_mode', 'playtime_summary_mode_var'),
+    ('enable_debug_mode', 'debug_mode_var'),
+    ('enable_telemetry', 'enable_telemetry_var'),
+    ('system_audio_level', 'system_audio_slider_var'),
+    ('enable_system_audio', 'enable_system_audio_var'),
+    ('game_audio_level', 'game_audio_slider_var'),
+    ('enable_game_audio', 'enable_game_audio_var'),
+    ('enable_during_power', 'enable_during_power_var'),
+    ('during_power_plan', 'during_power_var'),
+    ('enable_after_power', 'enable_after_power_var'),
+    ('after_power_plan', 'after_power_var'),
+    ('enable_game_mode_start', 'enable_game_mode_start_var'),
+    ('enable_game_mode_end', 'enable_game_mode_end_var'),
+    ('enable_cpu_thermal', 'enable_cpu_thermal_var'),
+    ('enable_gpu_thermal', 'enable_gpu_thermal_var'),
+    ('enable_cpu_temp_alert', 'enable_cpu_temp_alert_var'),
+    ('enable_gpu_temp_alert', 'enable_gpu_temp_alert_var'),
+)
+
+
+def _setting_value(key, var_name):
+    """Read a setting from its Tk variable, or from ui.state if its tab hasn't been built."""
+    var = getattr(state, var_name)
+    return var.get() if var is not None else getattr(state, key)
 
 
 def on_save():
     """Save current settings to file. Returns True if saved successfully, False if cancelled."""
     debug_log("Save button clicked", "Settings")
 
-    # Collect values from UI state
+    # Collect values from UI state. Tabs that were never opened can't have been edited,
+    # so their settings come from ui.state rather than building the tab just to read it
+    # (this also runs when a game start auto-closes the window)
     new_selected_notification_apps = [name for name, var in state.switch_vars.items() if var.get()]
-    raw_customs = [c.strip() for c in state.custom_entry.get().split(',') if c.strip()]
-    new_selected_resource_apps = [name for name, var in state.resource_switch_vars.items() if var.get()]
-    raw_resource_customs = [c.strip() for c in state.custom_resource_entry.get().split(',') if c.strip()]
+    raw_customs = [c for c in _CSV_RE.split(state.custom_entry.get().strip()) if c]
+    if state.custom_resource_entry is not None:
+        new_selected_resource_apps = [name for name, var in state.resource_switch_vars.items() if var.get()]
+        raw_resource_customs = [c for c in _CSV_RE.split(state.custom_resource_entry.get().strip()) if c]
+    else:
+        new_selected_resource_apps = list(state.selected_resource_apps)
+        raw_resource_customs = list(state.custom_resource_processes)
 
     # Filter out protected processes
     blocked = []
     new_customs = []
     for proc in raw_customs:
-        if proc.lower() in PROTECTED_PROCESSES:
+        if is_protected_process(proc):
             blocked.append(proc)
         else:
             new_customs.append(proc)
 
     new_resource_customs = []
     for proc in raw_resource_customs:
-        if proc.lower() in PROTECTED_PROCESSES:
+        if is_protected_process(proc):
             blocked.append(proc)
         else:
             new_resource_customs.append(proc)
@@ -150,71 +176,34 @@ def on_save():
         )
         state.custom_entry.delete(0, 'end')
         state.custom_entry.insert(0, ', '.join(new_customs))
-        state.custom_resource_entry.delete(0, 'end')
-        state.custom_resource_entry.insert(0, ', '.join(new_resource_customs))
+        if state.custom_resource_entry is not None:
+            state.custom_resource_entry.delete(0, 'end')
+            state.custom_resource_entry.insert(0, ', '.join(new_resource_customs))
 
     # Collect all settings from state variables
-    new_launch_startup = state.startup_var.get()
-    new_launch_settings_on_start = state.launch_settings_on_start_var.get()
-    new_close_on_startup = state.close_startup_var.get() == "Enabled"
-    new_close_on_hotkey = state.close_hotkey_var.get() == "Enabled"
-    new_relaunch_on_exit = state.relaunch_exit_var.get() == "Enabled"
-    new_resource_close_on_startup = state.resource_close_startup_var.get() == "Enabled"
-    new_resource_close_on_hotkey = state.resource_close_hotkey_var.get() == "Enabled"
-    new_resource_relaunch_on_exit = state.resource_relaunch_exit_var.get() == "Enabled"
-    new_enable_playtime_summary = state.playtime_summary_var.get()
-    new_playtime_summary_mode = state.playtime_summary_mode_var.get()
-    new_enable_debug_mode = state.debug_mode_var.get()
-    new_enable_telemetry = state.enable_telemetry_var.get()
-    new_system_audio_level = state.system_audio_slider_var.get()
-    new_enable_system_audio = state.enable_system_audio_var.get()
-    new_game_audio_level = state.game_audio_slider_var.get()
-    new_enable_game_audio = state.enable_game_audio_var.get()
-    new_enable_during_power = state.enable_during_power_var.get()
-    new_during_power_plan = state.during_power_var.get()
-    new_enable_after_power = state.enable_after_power_var.get()
-    new_after_power_plan = state.after_power_var.get()
-    new_enable_game_mode_start = state.enable_game_mode_start_var.get()
-    new_enable_game_mode_end = state.enable_game_mode_end_var.get()
-    new_enable_cpu_thermal = state.enable_cpu_thermal_var.get()
-    new_enable_gpu_thermal = state.enable_gpu_thermal_var.get()
-    new_enable_cpu_temp_alert = state.enable_cpu_temp_alert_var.get()
-    new_enable_gpu_temp_alert = state.enable_gpu_temp_alert_var.get()
+    settings = {
+        'selected_notification_apps': new_selected_notification_apps,
+        'custom_processes': new_customs,
+        'selected_resource_apps': new_selected_resource_apps,
+        'custom_resource_processes': new_resource_customs,
+        **{key: _setting_value(key, var_name) for key, var_name in _SETTING_VARS},
+    }
 
     # Parse threshold values
-    try:
-        new_cpu_temp_warning_threshold = int(state.cpu_temp_warning_threshold_var.get())
-    except (ValueError, AttributeError):
-        new_cpu_temp_warning_threshold = 85
-    try:
-        new_cpu_temp_critical_threshold = int(state.cpu_temp_critical_threshold_var.get())
-    except (ValueError, AttributeError):
-        new_cpu_temp_critical_threshold = 95
-    try:
-        new_gpu_temp_warning_threshold = int(state.gpu_temp_warning_threshold_var.get())
-    except (ValueError, AttributeError):
-        new_gpu_temp_warning_threshold = 80
-    try:
-        new_gpu_temp_critical_threshold = int(state.gpu_temp_critical_threshold_var.get())
-    except (ValueError, AttributeError):
-        new_gpu_temp_critical_threshold = 90
+    for key, fallback in (('cpu_temp_warning_threshold', 85), ('cpu_temp_critical_threshold', 95),
+                          ('gpu_temp_warning_threshold', 80), ('gpu_temp_critical_threshold', 90)):
+        try:
+            settings[key] = int(getattr(state, f'{key}_var').get())
+        except (ValueError, AttributeError):
+            settings[key] = fallback
 
     # Save settings
-    save_settings_to_file(
-        new_selected_notification_apps, new_customs, new_selected_resource_apps, new_resource_customs,
-        new_launch_startup, new_launch_settings_on_start, new_close_on_startup, new_close_on_hotkey,
-        new_relaunch_on_exit, new_resource_close_on_startup, new_resource_close_on_hotkey,
-        new_resource_relaunch_on_exit, new_enable_playtime_summary, new_playtime_summary_mode,
-        new_enable_debug_mode, new_enable_telemetry, new_system_audio_level, new_enable_system_audio,
-        new_game_audio_level, new_enable_game_audio, new_enable_during_power, new_during_power_plan,
-        new_enable_after_power, new_after_power_plan, new_enable_game_mode_start, new_enable_game_mode_end,
-        new_enable_cpu_thermal, new_enable_gpu_thermal, new_enable_cpu_temp_alert,
-        new_cpu_temp_warning_threshold, new_cpu_temp_critical_threshold, new_enable_gpu_temp_alert,
-        new_gpu_temp_warning_threshold, new_gpu_temp_critical_threshold
-    )
+    save_settings_to_file(settings)
 
     state.mark_clean()
 
+    new_enable_cpu_thermal = settings['enable_cpu_thermal']
+
     # Check if CPU thermal is enabled and Vapor needs to restart with admin privileges
     if new_enable_cpu_thermal and not is_admin():
         response = show_vapor_dialog(
@@ -235,14 +224,12 @@ def on_save():
             height=450
         )
         if response is True:
-            set_pending_pawnio_check(True)
-            set_pending_settings_reopen(True)
+            set_pending_admin_restart(True)
             if restart_vapor(state.main_pid, require_admin=True):
                 state.root.destroy()
                 return True
             else:
-                set_pending_pawnio_check(False)
-                set_pending_settings_reopen(False)
+                set_pending_admin_restart(False)
                 show_vapor_dialog(
                     title="Elevation Failed",
                     message="Failed to restart Vapor with admin privileges.\n\n"
@@ -304,7 +291,7 @@ def on_save():
 
             # Use plain tk widgets for instant rendering (CTk widgets flash white)
             msg_label = tk.Label(installing_dialog, text="Installing PawnIO driver...",
-                                 font=("Calibri", 13), fg="white", bg="#2b2b2b")
+                                 font=FONT_DESCRIPTION, fg="white", bg="#2b2b2b")
             msg_label.pack(padx=20, pady=(25, 10))
 
             progress_bar = ctk.CTkProgressBar(installing_dialog, width=300)
@@ -312,7 +299,7 @@ def on_save():
             progress_bar.set(0)
 
             status_label = tk.Label(installing_dialog, text="Please wait while the driver is installed...",
-                                    font=("Calibri", 11), fg="gray", bg="#2b2b2b")
+                                    font=FONT_SMALL, fg="gray", bg="#2b2b2b")
             status_label.pack(padx=20, pady=(5, 15))
 
             # Force full widget rendering before showing
@@ -379,7 +366,7 @@ def on_save():
                 )
                 if state.main_pid:
                     try:
-                        psutil.Process(state.main_pid).terminate()
+                        state.get_main_process().terminate()
                     except Exception:
                         pass
                 state.root.destroy()
@@ -401,6 +388,7 @@ def on_save():
             state.enable_cpu_thermal_var.set(False)
 
     # Check if debug mode changed and needs restart
+    new_enable_debug_mode = settings['enable_debug_mode']
     if new_enable_debug_mode != state.enable_debug_mode:
         debug_log(f"Debug mode changed from {state.enable_debug_mode} to {new_enable_debug_mode}", "Settings")
         response = show_vapor_dialog(
@@ -426,6 +414,12 @@ def on_save():
 def on_save_and_close():
     """Save settings and close the window."""
     debug_log("Save & Close clicked", "Settings")
+    # Nothing changed since the last save - skip rewriting the file (and the main
+    # process's settings reload it triggers, e.g. when a game start auto-closes this window)
+    if not state.is_dirty():
+        debug_log("No unsaved changes - closing without saving", "Settings")
+        state.root.destroy()
+        return
     if on_save():
         state.root.destroy()
 
@@ -440,10 +434,10 @@ def on_stop_vapor():
     """Terminate the main Vapor process and close settings."""
     debug_log("Stop Vapor clicked", "Settings")
     if state.main_pid:
+        import psutil
         try:
             debug_log(f"Terminating main Vapor process (PID: {state.main_pid})", "Settings")
-            main_process = psutil.Process(state.main_pid)
-            main_process.terminate()
+            state.get_main_process().terminate()
             debug_log("Main process terminated", "Settings")
         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
             debug_log(f"Could not terminate: {e}", "Settings")
@@ -453,9 +447,9 @@ def on_stop_vapor():
 def check_main_process():
     """Auto-close settings if main Vapor process exits."""
     if state.main_pid:
+        import psutil
         try:
-            main_process = psutil.Process(state.main_pid)
-            if not main_process.is_running():
+            if not state.get_main_process().is_running():
                 state.root.destroy()
                 return
         except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -464,6 +458,35 @@ def check_main_process():
     state.root.after(1000, check_main_process)
 
 
+def watch_main_process():
+    """
+    Auto-close settings when the main Vapor process exits, without polling.
+    A daemon thread blocks on the process handle and posts <<VaporMainExited>> to
+    the Tk thread on every exit path (event_generate with when='tail' only queues
+    the event, which the Tk thread then handles). Falls back to check_main_process
+    if the handle can't be opened or the wait fails.
+    """
+    exited = [False]
+
+    def wait_for_exit():
+        try:
+            exited[0] = wait_for_process_exit(state.main_pid)
+        finally:
+            try:
+                state.root.event_generate("<<VaporMainExited>>", when="tail")
+            except (RuntimeError, tk.TclError):
+                pass  # Settings window is already closing
+
+    def on_main_exited(event):
+        if exited[0]:
+            state.root.destroy()
+        else:
+            check_main_process()
+
+    state.root.bind("<<VaporMainExited>>", on_main_exited)
+    threading.Thread(target=wait_for_exit, name="vapor-main-watch", daemon=True).start()
+
+
 def check_game_started_signal():
     """Check if a game has started and auto-save/close settings if so."""
     try:
@@ -550,7 +573,7 @@ def check_pending_pawnio_install():
 
         # Use plain tk widgets for instant rendering (CTk widgets flash white)
         msg_label = tk.Label(installing_dialog, text="Installing PawnIO driver...",
-                             font=("Calibri", 13), fg="white", bg="#2b2b2b")
+                             font=FONT_DESCRIPTION, fg="white", bg="#2b2b2b")
         msg_label.pack(padx=20, pady=(25, 10))
 
         progress_bar = ctk.CTkProgressBar(installing_dialog, width=300)
@@ -558,7 +581,7 @@ def check_pending_pawnio_install():
         progress_bar.set(0)
 
         status_label = tk.Label(installing_dialog, text="Please wait while the driver is installed...",
-                                font=("Calibri", 11), fg="gray", bg="#2b2b2b")
+                                font=FONT_SMALL, fg="gray", bg="#2b2b2b")
         status_label.pack(padx=20, pady=(5, 15))
 
         # Force full widget rendering before showing
@@ -625,7 +648,7 @@ def check_pending_pawnio_install():
             )
             if state.main_pid:
                 try:
-                    psutil.Process(state.main_pid).terminate()
+                    state.get_main_process().terminate()
                 except Exception:
                     pass
             state.root.destroy()
@@ -650,6 +673,9 @@ def check_pending_pawnio_install():
 
 def run_settings_ui():
     """Main entry point for the Settings UI."""
+    # Decode the app icons in the background while the window and tabs are set up
+    prefetch_icons(BUILT_IN_ICON_PATHS)
+
     # Create main window
     state.root = ctk.CTk()
     state.root.withdraw()  # Hide while setting up
@@ -693,36 +719,31 @@ def run_settings_ui():
         except Exception as e:
             print(f"Error setting icon: {e}")
 
-    state.root.deiconify()
-    state.root.update()
+    def bring_to_front():
+        state.root.lift()
+        state.root.attributes('-topmost', True)
+        state.root.after(100, lambda: state.root.attributes('-topmost', False))
+        state.root.focus_force()
 
-    state.root.lift()
-    state.root.attributes('-topmost', True)
-    state.root.after(100, lambda: state.root.attributes('-topmost', False))
-    state.root.focus_force()
+    # Raised and focused once mainloop reaches idle, after the window is shown below
+    state.root.after_idle(bring_to_front)
 
     # Load settings
     settings_dict = load_settings_dict()
     state.load_settings_into_state(settings_dict)
 
-    # Get main process PID
-    if os.environ.get('VAPOR_MAIN_PID'):
-        try:
-            state.main_pid = int(os.environ.get('VAPOR_MAIN_PID'))
-        except ValueError:
-            pass
-    elif len(sys.argv) > 1:
-        if sys.argv[1] == '--ui':
-            if len(sys.argv) > 2:
-                try:
-                    state.main_pid = int(sys.argv[2])
-                except ValueError:
-                    pass
-        else:
-            try:
-                state.main_pid = int(sys.argv[1])
-            except ValueError:
+    # Get main process PID - from the environment, or argv as "<pid>" or "--ui <pid>"
+    pid_arg = os.environ.get('VAPOR_MAIN_PID')
+    if not pid_arg:
+        match sys.argv[1:]:
+            case ['--ui', pid_arg, *_]:
+                pass
+            case ['--ui', *_]:
+                pid_arg = None
+            case [pid_arg, *_]:
                 pass
+    if pid_arg and pid_arg.isdigit():
+        state.main_pid = int(pid_arg)
 
     # Debug console attachment if enabled
     if state.enable_debug_mode:
@@ -740,7 +761,7 @@ def run_settings_ui():
             pass
 
     # Create tab view
-    state.tabview = ctk.CTkTabview(master=state.root)
+    state.tabview = ctk.CTkTabview(master=state.root, command=lambda: build_pending_tab(state.tabview.get()))
     state.tabview.pack(pady=10, padx=10, fill="both", expand=True)
 
     notifications_tab = state.tabview.add(TAB_NOTIFICATIONS)
@@ -750,13 +771,18 @@ def run_settings_ui():
     help_tab = state.tabview.add(TAB_HELP)
     about_tab = state.tabview.add(TAB_ABOUT)
 
-    # Build all tabs
+    # Build the visible Notifications tab and the Thermal tab (startup PawnIO checks use
+    # its variables) now; the rest are built the first time they are selected. Thermal's
+    # live readout, which imports the hardware monitoring libraries, also waits for that.
     build_notifications_tab(notifications_tab)
-    build_resources_tab(resources_tab)
     build_thermal_tab(thermal_tab)
-    build_preferences_tab(preferences_tab)
-    build_help_tab(help_tab)
-    build_about_tab(about_tab)
+    _pending_tab_builds.update({
+        TAB_THERMAL: start_temperature_display,
+        TAB_RESOURCES: lambda: build_resources_tab(resources_tab),
+        TAB_PREFERENCES: lambda: build_preferences_tab(preferences_tab),
+        TAB_HELP: lambda: build_help_tab(help_tab),
+        TAB_ABOUT: lambda: build_about_tab(about_tab),
+    })
 
     # Bottom button bar
     bottom_separator = ctk.CTkFrame(master=state.root, height=2, fg_color="gray50")
@@ -772,7 +798,7 @@ def run_settings_ui():
     state.save_button = ctk.CTkButton(
         master=button_frame, text="Save & Close", command=on_save_and_close,
         corner_radius=10, fg_color="#28a745", hover_color="#218838",
-        text_color="white", width=150, font=("Calibri", 15)
+        text_color="white", width=150, font=FONT_LARGE
     )
     state.save_button.grid(row=0, column=1, padx=15, sticky='ew')
 
@@ -790,14 +816,14 @@ def run_settings_ui():
     discard_button = ctk.CTkButton(
         master=button_frame, text="Discard & Close", command=on_discard_and_close,
         corner_radius=10, fg_color="#6c757d", hover_color="#5a6268",
-        text_color="white", width=150, font=("Calibri", 15)
+        text_color="white", width=150, font=FONT_LARGE
     )
     discard_button.grid(row=0, column=2, padx=15, sticky='ew')
 
     stop_button = ctk.CTkButton(
         master=button_frame, text="Stop Vapor", command=on_stop_vapor,
         corner_radius=10, fg_color="#e67e22", hover_color="#d35400",
-        text_color="white", width=150, font=("Calibri", 15)
+        text_color="white", width=150, font=FONT_LARGE
     )
     stop_button.grid(row=0, column=3, padx=15, sticky='ew')
 
@@ -806,7 +832,7 @@ def run_settings_ui():
 
     # Start main process monitoring
     if state.main_pid:
-        state.root.after(1000, check_main_process)
+        state.root.after(0, watch_main_process)  # Timer, so it starts once mainloop is running
 
     # Clean up any existing game-started signal so we only respond to NEW game starts
     # This prevents the settings window from immediately closing if opened mid-game
@@ -823,5 +849,10 @@ def run_settings_ui():
     # Check for pending PawnIO installation
     state.root.after(500, check_pending_pawnio_install)
 
+    # The window stays withdrawn while the widgets above are created and packed, so Tk
+    # lays it out once here instead of repainting as each tab is built
+    state.root.update_idletasks()
+    state.root.deiconify()
+
     # Start the UI
     state.root.mainloop()
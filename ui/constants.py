@@ -12,53 +12,65 @@ TAB_PREFERENCES   = "  Preferences   "  # 11 chars centered in 16
 TAB_HELP          = "      Help      "  # 4 chars centered in 16
 TAB_ABOUT         = "     About      "  # 5 chars centered in 16
 
+# Shared font styles - one tuple per style instead of a new literal at every widget
+FONT_BODY = ("Calibri", 14)
+FONT_SECTION = ("Calibri", 17, "bold")
+FONT_DESCRIPTION = ("Calibri", 13)
+FONT_NOTE = ("Calibri", 12)
+FONT_HEADING = ("Calibri", 15, "bold")
+FONT_SMALL = ("Calibri", 11)
+FONT_LARGE = ("Calibri", 15)
+FONT_BODY_BOLD = ("Calibri", 14, "bold")
+FONT_LINK = ("Calibri", 14, "underline")
+FONT_TAB_TITLE = ("Calibri", 25, "bold")
+FONT_ABOUT_TITLE = ("Calibri", 29, "bold")
+FONT_TEMPERATURE = ("Calibri", 32, "bold")
+FONT_DIALOG_TITLE = ("Calibri", 21, "bold")
+FONT_DIALOG_BUTTON = ("Calibri", 16)
+
+IMAGES_DIR = os.path.join(base_dir, 'Images')
+
+# Built-in apps are (display name, process names, icon path) rows - plain tuples rather
+# than one dict per app, unpacked directly by the row builders
+
 # Notification/messaging apps that can be closed during gaming
-BUILT_IN_APPS = [
-    {'display_name': 'WhatsApp', 'processes': ['WhatsApp.Root.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'whatsapp_icon.png')},
-    {'display_name': 'Discord', 'processes': ['Discord.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'discord_icon.png')},
-    {'display_name': 'Telegram', 'processes': ['Telegram.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'telegram_icon.png')},
-    {'display_name': 'Microsoft Teams', 'processes': ['ms-teams.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'teams_icon.png')},
-    {'display_name': 'Facebook Messenger', 'processes': ['Messenger.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'messenger_icon.png')},
-    {'display_name': 'Slack', 'processes': ['slack.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'slack_icon.png')},
-    {'display_name': 'Signal', 'processes': ['Signal.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'signal_icon.png')},
-    {'display_name': 'WeChat', 'processes': ['WeChat.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'wechat_icon.png')}
-]
+BUILT_IN_APPS = (
+    ('WhatsApp', ('WhatsApp.Root.exe',), os.path.join(IMAGES_DIR, 'whatsapp_icon.png')),
+    ('Discord', ('Discord.exe',), os.path.join(IMAGES_DIR, 'discord_icon.png')),
+    ('Telegram', ('Telegram.exe',), os.path.join(IMAGES_DIR, 'telegram_icon.png')),
+    ('Microsoft Teams', ('ms-teams.exe',), os.path.join(IMAGES_DIR, 'teams_icon.png')),
+    ('Facebook Messenger', ('Messenger.exe',), os.path.join(IMAGES_DIR, 'messenger_icon.png')),
+    ('Slack', ('slack.exe',), os.path.join(IMAGES_DIR, 'slack_icon.png')),
+    ('Signal', ('Signal.exe',), os.path.join(IMAGES_DIR, 'signal_icon.png')),
+    ('WeChat', ('WeChat.exe',), os.path.join(IMAGES_DIR, 'wechat_icon.png')),
+)
 
 # Resource-heavy apps organized by category
-BUILT_IN_RESOURCE_APPS = [
+BUILT_IN_RESOURCE_APPS = (
     # Browsers (indices 0-3)
-    {'display_name': 'Chrome', 'processes': ['chrome.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'chrome_icon.png')},
-    {'display_name': 'Firefox', 'processes': ['firefox.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'firefox_icon.png')},
-    {'display_name': 'Edge', 'processes': ['msedge.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'edge_icon.png')},
-    {'display_name': 'Opera', 'processes': ['opera.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'opera_icon.png')},
+    ('Chrome', ('chrome.exe',), os.path.join(IMAGES_DIR, 'chrome_icon.png')),
+    ('Firefox', ('firefox.exe',), os.path.join(IMAGES_DIR, 'firefox_icon.png')),
+    ('Edge', ('msedge.exe',), os.path.join(IMAGES_DIR, 'edge_icon.png')),
+    ('Opera', ('opera.exe',), os.path.join(IMAGES_DIR, 'opera_icon.png')),
     # Cloud/Media (indices 4-7)
-    {'display_name': 'Spotify', 'processes': ['spotify.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'spotify_icon.png')},
-    {'display_name': 'OneDrive', 'processes': ['OneDrive.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'onedrive_icon.png')},
-    {'display_name': 'Google Drive', 'processes': ['GoogleDriveFS.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'googledrive_icon.png')},
-    {'display_name': 'Dropbox', 'processes': ['Dropbox.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'dropbox_icon.png')},
+    ('Spotify', ('spotify.exe',), os.path.join(IMAGES_DIR, 'spotify_icon.png')),
+    ('OneDrive', ('OneDrive.exe',), os.path.join(IMAGES_DIR, 'onedrive_icon.png')),
+    ('Google Drive', ('GoogleDriveFS.exe',), os.path.join(IMAGES_DIR, 'googledrive_icon.png')),
+    ('Dropbox', ('Dropbox.exe',), os.path.join(IMAGES_DIR, 'dropbox_icon.png')),
     # Gaming Utilities (indices 8-11)
-    {'display_name': 'Wallpaper Engine', 'processes': ['wallpaper64.exe', 'wallpaper32.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'wallpaperengine_icon.png')},
-    {'display_name': 'iCUE', 'processes': ['iCUE.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'icue_icon.png')},
-    {'display_name': 'Razer Synapse', 'processes': ['RazerCentralService.exe', 'Razer Synapse 3.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'razer_icon.png')},
-    {'display_name': 'NZXT CAM', 'processes': ['NZXT CAM.exe'],
-     'icon_path': os.path.join(base_dir, 'Images', 'nzxtcam_icon.png')}
-]
+    ('Wallpaper Engine', ('wallpaper64.exe', 'wallpaper32.exe'), os.path.join(IMAGES_DIR, 'wallpaperengine_icon.png')),
+    ('iCUE', ('iCUE.exe',), os.path.join(IMAGES_DIR, 'icue_icon.png')),
+    ('Razer Synapse', ('RazerCentralService.exe', 'Razer Synapse 3.exe'), os.path.join(IMAGES_DIR, 'razer_icon.png')),
+    ('NZXT CAM', ('NZXT CAM.exe',), os.path.join(IMAGES_DIR, 'nzxtcam_icon.png')),
+)
+
+# Display name -> process names, for turning a saved selection into process lists
+BUILT_IN_APP_PROCESSES = {name: processes for name, processes, _ in BUILT_IN_APPS}
+BUILT_IN_RESOURCE_APP_PROCESSES = {name: processes for name, processes, _ in BUILT_IN_RESOURCE_APPS}
+
+# All built-in display names, for "is every app selected?" subset checks
+BUILT_IN_APP_NAMES = frozenset(BUILT_IN_APP_PROCESSES)
+BUILT_IN_RESOURCE_APP_NAMES = frozenset(BUILT_IN_RESOURCE_APP_PROCESSES)
+
+# Every built-in icon, for prefetching
+BUILT_IN_ICON_PATHS = tuple(icon_path for _, _, icon_path in (*BUILT_IN_APPS, *BUILT_IN_RESOURCE_APPS))
@@ -8,6 +8,7 @@ import tkinter as tk
 import customtkinter as ctk
 
 from utils import base_dir
+from ui.constants import FONT_BODY, FONT_DIALOG_TITLE, FONT_DIALOG_BUTTON
 
 
 def set_dark_title_bar(window):
@@ -109,7 +110,7 @@ def show_vapor_dialog(title, message, dialog_type="info", buttons=None, parent=N
     title_label = ctk.CTkLabel(
         master=content_frame,
         text=title,
-        font=("Calibri", 21, "bold"),
+        font=FONT_DIALOG_TITLE,
         text_color=title_color
     )
     title_label.pack(pady=(0, 15))
@@ -118,7 +119,7 @@ def show_vapor_dialog(title, message, dialog_type="info", buttons=None, parent=N
     message_label = ctk.CTkLabel(
         master=content_frame,
         text=message,
-        font=("Calibri", 14),
+        font=FONT_BODY,
         justify="left",
         wraplength=width - 50
     )
@@ -171,7 +172,7 @@ def show_vapor_dialog(title, message, dialog_type="info", buttons=None, parent=N
             corner_radius=10,
             fg_color=fg_color,
             hover_color=hover_color,
-            font=("Calibri", 16)
+            font=FONT_DIALOG_BUTTON
         )
         btn.pack(side="left", padx=15)
 
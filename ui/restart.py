@@ -4,7 +4,6 @@
 import os
 import sys
 import ctypes
-import psutil
 
 from utils import log as debug_log
 from platform_utils import is_admin
@@ -32,6 +31,7 @@ def restart_vapor(main_pid, require_admin=False, delay_seconds=3):
     should_terminate_main = main_pid and main_pid != current_pid
 
     if should_terminate_main:
+        import psutil
         try:
             debug_log(f"Terminating main process {main_pid}", "Restart")
             main_process = psutil.Process(main_pid)
@@ -10,6 +10,7 @@ import tkinter as tk
 root = None
 tabview = None
 main_pid = None
+_main_process = None  # psutil.Process for main_pid, see get_main_process()
 
 # Settings loaded at startup (populated by app.py)
 current_settings = {}
@@ -50,6 +51,23 @@ enable_gpu_temp_alert = False
 gpu_temp_warning_threshold = 80
 gpu_temp_critical_threshold = 90
 
+# Module variables above that mirror a settings key of the same name
+_STATE_SETTING_KEYS = (
+    'selected_notification_apps', 'custom_processes', 'selected_resource_apps',
+    'custom_resource_processes', 'launch_at_startup', 'launch_settings_on_start',
+    'close_on_startup', 'close_on_hotkey', 'relaunch_on_exit', 'resource_close_on_startup',
+    'resource_close_on_hotkey', 'resource_relaunch_on_exit', 'enable_playtime_summary',
+    'playtime_summary_mode', 'enable_debug_mode', 'enable_telemetry', 'system_audio_level',
+    'enable_system_audio', 'game_audio_level', 'enable_game_audio', 'enable_during_power',
+    'during_power_plan', 'enable_after_power', 'after_power_plan', 'enable_game_mode_start',
+    'enable_game_mode_end', 'enable_cpu_thermal', 'enable_gpu_thermal', 'enable_cpu_temp_alert',
+    'cpu_temp_warning_threshold', 'cpu_temp_critical_threshold', 'enable_gpu_temp_alert',
+    'gpu_temp_warning_threshold', 'gpu_temp_critical_threshold',
+)
+
+# The initial values above, used for keys missing from a loaded settings dict
+_STATE_DEFAULTS = {key: globals()[key] for key in _STATE_SETTING_KEYS}
+
 # UI state tracking - maps app names to their BooleanVar
 switch_vars = {}
 resource_switch_vars = {}
@@ -58,6 +76,9 @@ resource_switch_vars = {}
 _is_dirty = False
 _original_title = "Vapor Settings"
 
+# Last-saved values of variables registered via watch_var (keyed by Tk variable name)
+_watched_vars = {}
+
 # UI widget references that need to be accessed across modules
 # These are set by the modules that create them
 save_button = None
@@ -132,10 +153,23 @@ def mark_dirty(*args):
         start_save_button_pulse()
 
 
+def watch_var(var):
+    """Mark dirty on writes to var, but only when its value differs from the last save."""
+    _watched_vars[str(var)] = [var, var.get()]
+
+    def on_write(*args):
+        if var.get() != _watched_vars[str(var)][1]:
+            mark_dirty()
+
+    var.trace_add("write", on_write)
+
+
 def mark_clean():
     """Mark that all changes have been saved."""
     global _is_dirty
     _is_dirty = False
+    for entry in _watched_vars.values():
+        entry[1] = entry[0].get()
     if root:
         root.title(_original_title)
     stop_save_button_pulse()
@@ -246,54 +280,23 @@ def stop_save_button_pulse():
 
 def load_settings_into_state(settings_dict):
     """Load settings dictionary into module state variables."""
-    global current_settings, selected_notification_apps, custom_processes
-    global selected_resource_apps, custom_resource_processes
-    global launch_at_startup, launch_settings_on_start, close_on_startup
-    global close_on_hotkey, relaunch_on_exit, resource_close_on_startup
-    global resource_close_on_hotkey, resource_relaunch_on_exit
-    global enable_playtime_summary, playtime_summary_mode, enable_debug_mode
-    global enable_telemetry, system_audio_level, enable_system_audio
-    global game_audio_level, enable_game_audio, enable_during_power
-    global during_power_plan, enable_after_power, after_power_plan
-    global enable_game_mode_start, enable_game_mode_end
-    global enable_cpu_thermal, enable_gpu_thermal
-    global enable_cpu_temp_alert, cpu_temp_warning_threshold, cpu_temp_critical_threshold
-    global enable_gpu_temp_alert, gpu_temp_warning_threshold, gpu_temp_critical_threshold
-
+    global current_settings
     current_settings = settings_dict
-
-    selected_notification_apps = settings_dict.get('selected_notification_apps',
-                                                    settings_dict.get('selected_apps', []))
-    custom_processes = settings_dict.get('custom_processes', [])
-    selected_resource_apps = settings_dict.get('selected_resource_apps', [])
-    custom_resource_processes = settings_dict.get('custom_resource_processes', [])
-    launch_at_startup = settings_dict.get('launch_at_startup', False)
-    launch_settings_on_start = settings_dict.get('launch_settings_on_start', True)
-    close_on_startup = settings_dict.get('close_on_startup', True)
-    close_on_hotkey = settings_dict.get('close_on_hotkey', False)
-    relaunch_on_exit = settings_dict.get('relaunch_on_exit', True)
-    resource_close_on_startup = settings_dict.get('resource_close_on_startup', True)
-    resource_close_on_hotkey = settings_dict.get('resource_close_on_hotkey', False)
-    resource_relaunch_on_exit = settings_dict.get('resource_relaunch_on_exit', True)
-    enable_playtime_summary = settings_dict.get('enable_playtime_summary', True)
-    playtime_summary_mode = settings_dict.get('playtime_summary_mode', 'brief')
-    enable_debug_mode = settings_dict.get('enable_debug_mode', False)
-    enable_telemetry = settings_dict.get('enable_telemetry', True)
-    system_audio_level = settings_dict.get('system_audio_level', 50)
-    enable_system_audio = settings_dict.get('enable_system_audio', False)
-    game_audio_level = settings_dict.get('game_audio_level', 50)
-    enable_game_audio = settings_dict.get('enable_game_audio', False)
-    enable_during_power = settings_dict.get('enable_during_power', False)
-    during_power_plan = settings_dict.get('during_power_plan', 'High Performance')
-    enable_after_power = settings_dict.get('enable_after_power', False)
-    after_power_plan = settings_dict.get('after_power_plan', 'Balanced')
-    enable_game_mode_start = settings_dict.get('enable_game_mode_start', False)
-    enable_game_mode_end = settings_dict.get('enable_game_mode_end', False)
-    enable_cpu_thermal = settings_dict.get('enable_cpu_thermal', False)
-    enable_gpu_thermal = settings_dict.get('enable_gpu_thermal', True)
-    enable_cpu_temp_alert = settings_dict.get('enable_cpu_temp_alert', False)
-    cpu_temp_warning_threshold = settings_dict.get('cpu_temp_warning_threshold', 85)
-    cpu_temp_critical_threshold = settings_dict.get('cpu_temp_critical_threshold', 95)
-    enable_gpu_temp_alert = settings_dict.get('enable_gpu_temp_alert', False)
-    gpu_temp_warning_threshold = settings_dict.get('gpu_temp_warning_threshold', 80)
-    gpu_temp_critical_threshold = settings_dict.get('gpu_temp_critical_threshold', 90)
+    values = {key: settings_dict.get(key, default) for key, default in _STATE_DEFAULTS.items()}
+    # Settings files from older versions stored the notification app selection as 'selected_apps'
+    values['selected_notification_apps'] = settings_dict.get('selected_notification_apps',
+                                                             settings_dict.get('selected_apps', []))
+    globals().update(values)
+
+
+def get_main_process():
+    """
+    Return a psutil.Process for main_pid, created on first use and reused after.
+    Reusing one object also lets is_running() spot a recycled PID.
+    Raises psutil.NoSuchProcess if the main process is already gone.
+    """
+    global _main_process
+    if _main_process is None:
+        import psutil
+        _main_process = psutil.Process(main_pid)
+    return _main_process
@@ -3,7 +3,7 @@
 
 from ui.tabs.notifications import build_notifications_tab
 from ui.tabs.resources import build_resources_tab
-from ui.tabs.thermal import build_thermal_tab
+from ui.tabs.thermal import build_thermal_tab, start_temperature_display
 from ui.tabs.preferences import build_preferences_tab
 from ui.tabs.help import build_help_tab
 from ui.tabs.about import build_about_tab
@@ -12,6 +12,7 @@ __all__ = [
     'build_notifications_tab',
     'build_resources_tab',
     'build_thermal_tab',
+    'start_temperature_display',
     'build_preferences_tab',
     'build_help_tab',
     'build_about_tab'
@@ -9,19 +9,14 @@ import sys
 import time
 import tkinter as tk
 import customtkinter as ctk
-import psutil
-import requests
 
 from utils import log as debug_log, appdata_dir, SETTINGS_FILE
 from platform_utils import is_admin, is_pawnio_installed
 from ui.dialogs import show_vapor_dialog
 from ui.restart import restart_vapor
 import ui.state as state
-
-try:
-    from updater import CURRENT_VERSION
-except ImportError:
-    CURRENT_VERSION = "Unknown"
+from ui.constants import FONT_BODY, FONT_SECTION, FONT_DESCRIPTION, FONT_NOTE, FONT_TAB_TITLE
+from ui.widgets import build_separator
 
 
 def build_help_tab(parent_frame):
@@ -37,21 +32,20 @@ def build_help_tab(parent_frame):
     help_scroll_frame = ctk.CTkScrollableFrame(master=parent_frame, fg_color="transparent")
     help_scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-    help_title = ctk.CTkLabel(master=help_scroll_frame, text="Help, Support & Bug Reports", font=("Calibri", 25, "bold"))
+    help_title = ctk.CTkLabel(master=help_scroll_frame, text="Help, Support & Bug Reports", font=FONT_TAB_TITLE)
     help_title.pack(pady=(10, 5), anchor='center')
 
     help_description = ctk.CTkLabel(master=help_scroll_frame,
                                     text="Get help with Vapor, troubleshoot issues, and submit bug reports.",
-                                    font=("Calibri", 14), text_color="gray60")
+                                    font=FONT_BODY, text_color="gray60")
     help_description.pack(pady=(0, 15), anchor='center')
 
-    help_sep1 = ctk.CTkFrame(master=help_scroll_frame, height=2, fg_color="gray50")
-    help_sep1.pack(fill="x", padx=40, pady=10)
+    build_separator(help_scroll_frame, pady=10)
 
     # =========================================================================
     # How Vapor Works Section
     # =========================================================================
-    how_title = ctk.CTkLabel(master=help_scroll_frame, text="How Vapor Works", font=("Calibri", 17, "bold"))
+    how_title = ctk.CTkLabel(master=help_scroll_frame, text="How Vapor Works", font=FONT_SECTION)
     how_title.pack(pady=(10, 10), anchor='center')
 
     how_text = """Vapor runs quietly in your system tray and monitors Steam for game launches. When you start
@@ -67,17 +61,16 @@ a Steam game, Vapor automatically:
 When you exit your game, Vapor reverses these changes, relaunches your closed apps, and
 displays a detailed session summary showing your playtime and performance stats."""
 
-    how_label = ctk.CTkLabel(master=help_scroll_frame, text=how_text, font=("Calibri", 14),
+    how_label = ctk.CTkLabel(master=help_scroll_frame, text=how_text, font=FONT_BODY,
                              wraplength=580, justify="left")
     how_label.pack(pady=10, padx=(40, 10), anchor='w')
 
-    help_sep2 = ctk.CTkFrame(master=help_scroll_frame, height=2, fg_color="gray50")
-    help_sep2.pack(fill="x", padx=40, pady=15)
+    build_separator(help_scroll_frame)
 
     # =========================================================================
     # Keyboard Shortcuts Section
     # =========================================================================
-    shortcuts_title = ctk.CTkLabel(master=help_scroll_frame, text="Keyboard Shortcuts", font=("Calibri", 17, "bold"))
+    shortcuts_title = ctk.CTkLabel(master=help_scroll_frame, text="Keyboard Shortcuts", font=FONT_SECTION)
     shortcuts_title.pack(pady=(10, 10), anchor='center')
 
     shortcuts_text = """Ctrl + Alt + K  -  Manually close all selected notification and resource apps
@@ -87,17 +80,16 @@ or Resources tab, pressing this combination will immediately close all toggled a
 in that category. This is useful for quickly silencing distractions before a meeting,
 stream, or any focus session - even when you're not gaming."""
 
-    shortcuts_label = ctk.CTkLabel(master=help_scroll_frame, text=shortcuts_text, font=("Calibri", 14),
+    shortcuts_label = ctk.CTkLabel(master=help_scroll_frame, text=shortcuts_text, font=FONT_BODY,
                                    wraplength=580, justify="left")
     shortcuts_label.pack(pady=10, padx=(40, 10), anchor='w')
 
-    help_sep3 = ctk.CTkFrame(master=help_scroll_frame, height=2, fg_color="gray50")
-    help_sep3.pack(fill="x", padx=40, pady=15)
+    build_separator(help_scroll_frame)
 
     # =========================================================================
     # Temperature Monitoring Section
     # =========================================================================
-    thermal_help_title = ctk.CTkLabel(master=help_scroll_frame, text="Temperature Monitoring", font=("Calibri", 17, "bold"))
+    thermal_help_title = ctk.CTkLabel(master=help_scroll_frame, text="Temperature Monitoring", font=FONT_SECTION)
     thermal_help_title.pack(pady=(10, 10), anchor='center')
 
     thermal_help_text = """Vapor can monitor your GPU and CPU temperatures while gaming and alert you if
@@ -112,17 +104,16 @@ they reach dangerous levels:
 Temperature data is also included in your post-game session summary, showing peak
 temperatures reached during your gaming session."""
 
-    thermal_help_label = ctk.CTkLabel(master=help_scroll_frame, text=thermal_help_text, font=("Calibri", 14),
+    thermal_help_label = ctk.CTkLabel(master=help_scroll_frame, text=thermal_help_text, font=FONT_BODY,
                                        wraplength=580, justify="left")
     thermal_help_label.pack(pady=10, padx=(40, 10), anchor='w')
 
-    help_sep3b = ctk.CTkFrame(master=help_scroll_frame, height=2, fg_color="gray50")
-    help_sep3b.pack(fill="x", padx=40, pady=15)
+    build_separator(help_scroll_frame)
 
     # =========================================================================
     # Troubleshooting Section
     # =========================================================================
-    trouble_title = ctk.CTkLabel(master=help_scroll_frame, text="Troubleshooting", font=("Calibri", 17, "bold"))
+    trouble_title = ctk.CTkLabel(master=help_scroll_frame, text="Troubleshooting", font=FONT_SECTION)
     trouble_title.pack(pady=(10, 10), anchor='center')
 
     trouble_text = """If Vapor isn't working as expected, try these steps:
@@ -134,24 +125,23 @@ temperatures reached during your gaming session."""
 
 If issues persist, submit a bug report below with logs attached."""
 
-    trouble_label = ctk.CTkLabel(master=help_scroll_frame, text=trouble_text, font=("Calibri", 14),
+    trouble_label = ctk.CTkLabel(master=help_scroll_frame, text=trouble_text, font=FONT_BODY,
                                  wraplength=580, justify="left")
     trouble_label.pack(pady=10, padx=(40, 10), anchor='w')
 
-    help_sep4 = ctk.CTkFrame(master=help_scroll_frame, height=2, fg_color="gray50")
-    help_sep4.pack(fill="x", padx=40, pady=15)
+    build_separator(help_scroll_frame)
 
     # =========================================================================
     # Reset Settings Section
     # =========================================================================
-    reset_title = ctk.CTkLabel(master=help_scroll_frame, text="Reset Settings", font=("Calibri", 17, "bold"))
+    reset_title = ctk.CTkLabel(master=help_scroll_frame, text="Reset Settings", font=FONT_SECTION)
     reset_title.pack(pady=(10, 5), anchor='center')
 
     reset_hint = ctk.CTkLabel(master=help_scroll_frame,
                               text="Use \"Reset Settings\" if Vapor is behaving unexpectedly or you want to start fresh.\n"
                                    "Use \"Reset All Data\" to completely clear all Vapor data including temperature\n"
                                    "history and cached game images. Both options will restart Vapor automatically.",
-                              font=("Calibri", 13), text_color="gray60", justify="center")
+                              font=FONT_DESCRIPTION, text_color="gray60", justify="center")
     reset_hint.pack(pady=(0, 10), anchor='center')
 
     def reset_settings_and_restart():
@@ -192,10 +182,10 @@ If issues persist, submit a bug report below with logs attached."""
         response = show_vapor_dialog(
             title="Reset All Data",
             message="This will delete ALL Vapor data including:\n\n"
-                    "• All settings\n"
-                    "• All temperature history\n"
-                    "• Lifetime max temperatures for all games\n"
-                    "• All cached game images\n\n"
+                    "\u2022 All settings\n"
+                    "\u2022 All temperature history\n"
+                    "\u2022 Lifetime max temperatures for all games\n"
+                    "\u2022 All cached game images\n\n"
                     "This cannot be undone. Vapor will restart with\n"
                     "fresh defaults. Are you sure?",
             dialog_type="warning",
@@ -244,42 +234,41 @@ If issues persist, submit a bug report below with logs attached."""
     rebuild_button = ctk.CTkButton(master=reset_buttons_frame, text="Reset Settings",
                                    command=reset_settings_and_restart, corner_radius=10,
                                    fg_color="#e67e22", hover_color="#d35400", text_color="white", width=160,
-                                   font=("Calibri", 14))
+                                   font=FONT_BODY)
     rebuild_button.pack(side='left', padx=5)
 
     reset_all_button = ctk.CTkButton(master=reset_buttons_frame, text="Delete All Data",
                                      command=reset_all_data_and_restart, corner_radius=10,
                                      fg_color="#c9302c", hover_color="#a02622", text_color="white", width=160,
-                                     font=("Calibri", 14))
+                                     font=FONT_BODY)
     reset_all_button.pack(side='left', padx=5)
 
     # =========================================================================
     # Bug Report Section
     # =========================================================================
-    help_sep5 = ctk.CTkFrame(master=help_scroll_frame, height=2, fg_color="gray50")
-    help_sep5.pack(fill="x", padx=40, pady=15)
+    build_separator(help_scroll_frame)
 
-    bug_report_title = ctk.CTkLabel(master=help_scroll_frame, text="Report a Bug", font=("Calibri", 17, "bold"))
+    bug_report_title = ctk.CTkLabel(master=help_scroll_frame, text="Report a Bug", font=FONT_SECTION)
     bug_report_title.pack(pady=(10, 5), anchor='center')
 
     bug_report_hint = ctk.CTkLabel(master=help_scroll_frame,
                                    text="Found a bug? Let us know! Your report will be submitted to GitHub Issues.",
-                                   font=("Calibri", 13), text_color="gray60")
+                                   font=FONT_DESCRIPTION, text_color="gray60")
     bug_report_hint.pack(pady=(0, 10), anchor='center')
 
-    bug_title_label = ctk.CTkLabel(master=help_scroll_frame, text="Title (brief summary)", font=("Calibri", 14))
+    bug_title_label = ctk.CTkLabel(master=help_scroll_frame, text="Title (brief summary)", font=FONT_BODY)
     bug_title_label.pack(pady=(5, 2), anchor='center')
 
-    bug_title_entry = ctk.CTkEntry(master=help_scroll_frame, width=400, height=32, font=("Calibri", 13),
+    bug_title_entry = ctk.CTkEntry(master=help_scroll_frame, width=400, height=32, font=FONT_DESCRIPTION,
                                    placeholder_text="e.g., App crashes when starting a game")
     bug_title_entry.pack(pady=(0, 10), anchor='center')
 
     bug_desc_label = ctk.CTkLabel(master=help_scroll_frame,
                                   text="Description (steps to reproduce, expected vs actual behavior)",
-                                  font=("Calibri", 14))
+                                  font=FONT_BODY)
     bug_desc_label.pack(pady=(5, 2), anchor='center')
 
-    bug_desc_textbox = ctk.CTkTextbox(master=help_scroll_frame, width=400, height=120, font=("Calibri", 13),
+    bug_desc_textbox = ctk.CTkTextbox(master=help_scroll_frame, width=400, height=120, font=FONT_DESCRIPTION,
                                       wrap="word")
     bug_desc_textbox.pack(pady=(0, 10), anchor='center')
 
@@ -289,26 +278,31 @@ If issues persist, submit a bug report below with logs attached."""
     include_system_info_var = ctk.BooleanVar(value=True)
     system_info_checkbox = ctk.CTkCheckBox(master=checkbox_frame,
                                             text="Include system information (OS, Vapor version, Python version)",
-                                            variable=include_system_info_var, font=("Calibri", 13))
+                                            variable=include_system_info_var, font=FONT_DESCRIPTION)
     system_info_checkbox.pack(pady=(0, 8), anchor='w')
 
     include_logs_var = ctk.BooleanVar(value=True)
     logs_checkbox = ctk.CTkCheckBox(master=checkbox_frame, text="Include recent logs (last 250 lines)",
-                                     variable=include_logs_var, font=("Calibri", 13))
+                                     variable=include_logs_var, font=FONT_DESCRIPTION)
     logs_checkbox.pack(pady=(0, 3), anchor='w')
 
     logs_disclaimer = ctk.CTkLabel(master=help_scroll_frame,
                                    text="Your Windows username is redacted from logs, but other folder names\n"
                                         "in paths where Vapor is running may be visible in the public report.",
-                                   font=("Calibri", 12), text_color="gray50")
+                                   font=FONT_NOTE, text_color="gray50")
     logs_disclaimer.pack(pady=(0, 10), anchor='center')
 
-    bug_status_label = ctk.CTkLabel(master=help_scroll_frame, text="", font=("Calibri", 13))
+    bug_status_label = ctk.CTkLabel(master=help_scroll_frame, text="", font=FONT_DESCRIPTION)
     bug_status_label.pack(pady=(0, 5), anchor='center')
 
     def get_system_info():
         """Collect system information for bug reports."""
         import platform
+        import psutil
+        try:
+            from updater import CURRENT_VERSION
+        except ImportError:
+            CURRENT_VERSION = "Unknown"
         info_lines = [
             f"- **Vapor Version**: {CURRENT_VERSION}",
             f"- **OS**: {platform.system()} {platform.release()} ({platform.version()})",
@@ -422,14 +416,12 @@ If issues persist, submit a bug report below with logs attached."""
         bug_status_label.configure(text="Submitting...", text_color="gray60")
         state.root.update()
 
+        import requests
         try:
-            proxy_url = "https://vapor-proxy.mortonapps.com/repos/Master00Sniper/Vapor/issues"
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "Vapor-BugReport/1.0",
-                "X-Vapor-Auth": "ombxslvdyyqvlkiiogwmjlkpocwqufaa",
-                "Content-Type": "application/json"
-            }
+            # Use the same proxy and auth header as the auto-updater
+            from updater import PROXY_BASE_URL, GITHUB_OWNER, GITHUB_REPO, HEADERS
+            proxy_url = f"{PROXY_BASE_URL}/repos/{GITHUB_OWNER}/{GITHUB_REPO}/issues"
+            headers = {**HEADERS, "User-Agent": "Vapor-BugReport/1.0", "Content-Type": "application/json"}
             payload = {"title": f"[Bug Report] {title}", "body": issue_body}
             response = requests.post(proxy_url, headers=headers, json=payload, timeout=15)
 
@@ -459,21 +451,20 @@ If issues persist, submit a bug report below with logs attached."""
 
     submit_bug_button = ctk.CTkButton(master=help_scroll_frame, text="Submit Bug Report", command=submit_bug_report,
                                       corner_radius=10, fg_color="#2563eb", hover_color="#1d4ed8",
-                                      text_color="white", width=180, font=("Calibri", 14))
+                                      text_color="white", width=180, font=FONT_BODY)
     submit_bug_button.pack(pady=(5, 20), anchor='center')
 
     # =========================================================================
     # Uninstall Section
     # =========================================================================
-    help_sep6 = ctk.CTkFrame(master=help_scroll_frame, height=2, fg_color="gray50")
-    help_sep6.pack(fill="x", padx=40, pady=15)
+    build_separator(help_scroll_frame)
 
-    uninstall_title = ctk.CTkLabel(master=help_scroll_frame, text="Uninstall Vapor", font=("Calibri", 17, "bold"))
+    uninstall_title = ctk.CTkLabel(master=help_scroll_frame, text="Uninstall Vapor", font=FONT_SECTION)
     uninstall_title.pack(pady=(10, 5), anchor='center')
 
     uninstall_hint = ctk.CTkLabel(master=help_scroll_frame,
                                   text="Completely remove Vapor and all associated data from your system.",
-                                  font=("Calibri", 13), text_color="gray60")
+                                  font=FONT_DESCRIPTION, text_color="gray60")
     uninstall_hint.pack(pady=(0, 10), anchor='center')
 
     def uninstall_vapor():
@@ -482,10 +473,10 @@ If issues persist, submit a bug report below with logs attached."""
         response = show_vapor_dialog(
             title="Uninstall Vapor",
             message="This will delete ALL Vapor data including:\n\n"
-                    "• All settings\n"
-                    "• All temperature history\n"
-                    "• All cached game images\n"
-                    "• All log files\n\n"
+                    "\u2022 All settings\n"
+                    "\u2022 All temperature history\n"
+                    "\u2022 All cached game images\n"
+                    "\u2022 All log files\n\n"
                     "After Vapor closes, you will need to manually delete\n"
                     "Vapor.exe to complete the uninstallation.\n\n"
                     "Are you sure you want to uninstall?",
@@ -518,10 +509,10 @@ If issues persist, submit a bug report below with logs attached."""
 
             debug_log("Stopping Vapor after uninstall", "Uninstall")
             if state.main_pid:
+                import psutil
                 try:
                     debug_log(f"Terminating main Vapor process (PID: {state.main_pid})", "Uninstall")
-                    main_process = psutil.Process(state.main_pid)
-                    main_process.terminate()
+                    state.get_main_process().terminate()
                     debug_log("Main process terminated", "Uninstall")
                 except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
                     debug_log(f"Could not terminate: {e}", "Uninstall")
@@ -531,7 +522,7 @@ If issues persist, submit a bug report below with logs attached."""
 
     uninstall_button = ctk.CTkButton(master=help_scroll_frame, text="Uninstall Vapor", command=uninstall_vapor,
                                      corner_radius=10, fg_color="#8b0000", hover_color="#5c0000",
-                                     text_color="white", width=180, font=("Calibri", 14))
+                                     text_color="white", width=180, font=FONT_BODY)
     uninstall_button.pack(pady=(5, 30), anchor='center')
 
     return {}
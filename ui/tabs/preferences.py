@@ -6,7 +6,11 @@ import tkinter as tk
 import customtkinter as ctk
 
 import ui.state as state
-from ui.constants import TAB_PREFERENCES
+from ui.constants import (
+    TAB_PREFERENCES,
+    FONT_BODY, FONT_SECTION, FONT_DESCRIPTION, FONT_NOTE, FONT_HEADING, FONT_SMALL, FONT_TAB_TITLE
+)
+from ui.widgets import build_separator
 from ui.dialogs import show_vapor_dialog
 
 
@@ -87,21 +91,20 @@ def build_preferences_tab(parent_frame):
     pref_scroll_frame = ctk.CTkScrollableFrame(master=parent_frame, fg_color="transparent")
     pref_scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-    preferences_title = ctk.CTkLabel(master=pref_scroll_frame, text="Preferences", font=("Calibri", 25, "bold"))
+    preferences_title = ctk.CTkLabel(master=pref_scroll_frame, text="Preferences", font=FONT_TAB_TITLE)
     preferences_title.pack(pady=(10, 5), anchor='center')
 
     pref_description = ctk.CTkLabel(master=pref_scroll_frame,
                                     text="Customize Vapor's behavior, audio settings, and power management options.",
-                                    font=("Calibri", 13), text_color="gray60")
+                                    font=FONT_DESCRIPTION, text_color="gray60")
     pref_description.pack(pady=(0, 15), anchor='center')
 
-    pref_sep1 = ctk.CTkFrame(master=pref_scroll_frame, height=2, fg_color="gray50")
-    pref_sep1.pack(fill="x", padx=40, pady=10)
+    build_separator(pref_scroll_frame, pady=10)
 
     # =========================================================================
     # General Settings Section
     # =========================================================================
-    general_title = ctk.CTkLabel(master=pref_scroll_frame, text="General Settings", font=("Calibri", 17, "bold"))
+    general_title = ctk.CTkLabel(master=pref_scroll_frame, text="General Settings", font=FONT_SECTION)
     general_title.pack(pady=(10, 10), anchor='center')
 
     general_frame = ctk.CTkFrame(master=pref_scroll_frame, fg_color="transparent")
@@ -109,13 +112,13 @@ def build_preferences_tab(parent_frame):
 
     state.launch_settings_on_start_var = tk.BooleanVar(value=state.launch_settings_on_start)
     launch_settings_on_start_switch = ctk.CTkSwitch(master=general_frame, text="Open Settings Window on Vapor Start",
-                                                    variable=state.launch_settings_on_start_var, font=("Calibri", 14),
+                                                    variable=state.launch_settings_on_start_var, font=FONT_BODY,
                                                     command=state.mark_dirty)
     launch_settings_on_start_switch.pack(pady=5, anchor='w')
 
     state.playtime_summary_var = tk.BooleanVar(value=state.enable_playtime_summary)
     playtime_summary_switch = ctk.CTkSwitch(master=general_frame, text="Show Playtime Summary After Gaming",
-                                            variable=state.playtime_summary_var, font=("Calibri", 14),
+                                            variable=state.playtime_summary_var, font=FONT_BODY,
                                             command=state.mark_dirty)
     playtime_summary_switch.pack(pady=5, anchor='w')
 
@@ -124,23 +127,23 @@ def build_preferences_tab(parent_frame):
     summary_mode_frame.pack(pady=(0, 5), anchor='w', padx=(30, 0))
 
     summary_mode_label = ctk.CTkLabel(master=summary_mode_frame, text="Summary Style:",
-                                      font=("Calibri", 13))
+                                      font=FONT_DESCRIPTION)
     summary_mode_label.pack(side="left", padx=(0, 10))
 
     state.playtime_summary_mode_var = tk.StringVar(value=state.playtime_summary_mode)
     ctk.CTkRadioButton(master=summary_mode_frame, text="Brief", variable=state.playtime_summary_mode_var,
-                       value="brief", font=("Calibri", 13), command=state.mark_dirty).pack(side="left", padx=10)
+                       value="brief", font=FONT_DESCRIPTION, command=state.mark_dirty).pack(side="left", padx=10)
     ctk.CTkRadioButton(master=summary_mode_frame, text="Detailed", variable=state.playtime_summary_mode_var,
-                       value="detailed", font=("Calibri", 13), command=state.mark_dirty).pack(side="left", padx=10)
+                       value="detailed", font=FONT_DESCRIPTION, command=state.mark_dirty).pack(side="left", padx=10)
 
     state.startup_var = tk.BooleanVar(value=state.launch_at_startup)
     state.startup_switch = ctk.CTkSwitch(master=general_frame, text="Launch Vapor at System Startup",
-                                         variable=state.startup_var, font=("Calibri", 14), command=state.mark_dirty)
+                                         variable=state.startup_var, font=FONT_BODY, command=state.mark_dirty)
     state.startup_switch.pack(pady=5, anchor='w')
 
     state.debug_mode_var = tk.BooleanVar(value=state.enable_debug_mode)
     state.debug_mode_switch = ctk.CTkSwitch(master=general_frame, text="Enable Debug Console Window",
-                                            variable=state.debug_mode_var, font=("Calibri", 14),
+                                            variable=state.debug_mode_var, font=FONT_BODY,
                                             command=state.mark_dirty)
     # Debug switch is hidden by default - revealed by Konami code easter egg
 
@@ -185,27 +188,26 @@ def build_preferences_tab(parent_frame):
         state.mark_dirty()
 
     state.telemetry_switch = ctk.CTkSwitch(master=state.telemetry_frame, text="Send Anonymous Usage Statistics",
-                                           variable=state.enable_telemetry_var, font=("Calibri", 14),
+                                           variable=state.enable_telemetry_var, font=FONT_BODY,
                                            command=on_telemetry_toggle)
     # Telemetry switch is hidden by default - revealed by Konami code easter egg
 
     state.telemetry_hint = ctk.CTkLabel(master=general_frame,
                                         text="No personal data is collected. Only used to see how many people use Vapor.",
-                                        font=("Calibri", 11), text_color="gray50")
+                                        font=FONT_SMALL, text_color="gray50")
     # telemetry_hint.pack hidden by default
 
     # =========================================================================
     # Audio Settings Section
     # =========================================================================
-    pref_sep2 = ctk.CTkFrame(master=pref_scroll_frame, height=2, fg_color="gray50")
-    pref_sep2.pack(fill="x", padx=40, pady=15)
+    build_separator(pref_scroll_frame)
 
-    audio_title = ctk.CTkLabel(master=pref_scroll_frame, text="Audio Settings", font=("Calibri", 17, "bold"))
+    audio_title = ctk.CTkLabel(master=pref_scroll_frame, text="Audio Settings", font=FONT_SECTION)
     audio_title.pack(pady=(10, 5), anchor='center')
 
     audio_hint = ctk.CTkLabel(master=pref_scroll_frame,
                               text="Automatically adjust volume levels when a game starts.",
-                              font=("Calibri", 12), text_color="gray60")
+                              font=FONT_NOTE, text_color="gray60")
     audio_hint.pack(pady=(0, 10), anchor='center')
 
     audio_frame = ctk.CTkFrame(master=pref_scroll_frame, fg_color="transparent")
@@ -215,7 +217,7 @@ def build_preferences_tab(parent_frame):
     system_audio_column = ctk.CTkFrame(master=audio_frame, fg_color="transparent")
     system_audio_column.pack(side="left", padx=40)
 
-    system_audio_label = ctk.CTkLabel(master=system_audio_column, text="System Volume", font=("Calibri", 15, "bold"))
+    system_audio_label = ctk.CTkLabel(master=system_audio_column, text="System Volume", font=FONT_HEADING)
     system_audio_label.pack(anchor='center')
 
     state.system_audio_slider_var = tk.IntVar(value=state.system_audio_level)
@@ -223,28 +225,27 @@ def build_preferences_tab(parent_frame):
                                         variable=state.system_audio_slider_var, width=180)
     system_audio_slider.pack(pady=5, anchor='center')
 
-    system_current_value_label = ctk.CTkLabel(master=system_audio_column, text=f"{state.system_audio_level}%",
-                                              font=("Calibri", 14))
-    system_current_value_label.pack(anchor='center')
-
-    def update_system_audio_label(value):
-        """Update the system audio percentage display."""
-        system_current_value_label.configure(text=f"{int(value)}%")
-        state.mark_dirty()
+    # The percentage label follows the slider's IntVar through a textvariable
+    system_value_text = tk.StringVar(value=f"{state.system_audio_level}%")
+    state.system_audio_slider_var.trace_add(
+        "write", lambda *args: system_value_text.set(f"{state.system_audio_slider_var.get()}%"))
+    state.watch_var(state.system_audio_slider_var)
 
-    system_audio_slider.configure(command=update_system_audio_label)
+    system_current_value_label = ctk.CTkLabel(master=system_audio_column, textvariable=system_value_text,
+                                              font=FONT_BODY)
+    system_current_value_label.pack(anchor='center')
 
     state.enable_system_audio_var = tk.BooleanVar(value=state.enable_system_audio)
     enable_system_audio_switch = ctk.CTkSwitch(master=system_audio_column, text="Enable",
                                                variable=state.enable_system_audio_var,
-                                               font=("Calibri", 14), command=state.mark_dirty)
+                                               font=FONT_BODY, command=state.mark_dirty)
     enable_system_audio_switch.pack(pady=8, anchor='center')
 
     # Game Volume column
     game_audio_column = ctk.CTkFrame(master=audio_frame, fg_color="transparent")
     game_audio_column.pack(side="left", padx=40)
 
-    game_audio_label = ctk.CTkLabel(master=game_audio_column, text="Game Volume", font=("Calibri", 15, "bold"))
+    game_audio_label = ctk.CTkLabel(master=game_audio_column, text="Game Volume", font=FONT_HEADING)
     game_audio_label.pack(anchor='center')
 
     state.game_audio_slider_var = tk.IntVar(value=state.game_audio_level)
@@ -252,21 +253,19 @@ def build_preferences_tab(parent_frame):
                                       variable=state.game_audio_slider_var, width=180)
     game_audio_slider.pack(pady=5, anchor='center')
 
-    game_current_value_label = ctk.CTkLabel(master=game_audio_column, text=f"{state.game_audio_level}%",
-                                            font=("Calibri", 14))
-    game_current_value_label.pack(anchor='center')
-
-    def update_game_audio_label(value):
-        """Update the game audio percentage display."""
-        game_current_value_label.configure(text=f"{int(value)}%")
-        state.mark_dirty()
+    game_value_text = tk.StringVar(value=f"{state.game_audio_level}%")
+    state.game_audio_slider_var.trace_add(
+        "write", lambda *args: game_value_text.set(f"{state.game_audio_slider_var.get()}%"))
+    state.watch_var(state.game_audio_slider_var)
 
-    game_audio_slider.configure(command=update_game_audio_label)
+    game_current_value_label = ctk.CTkLabel(master=game_audio_column, textvariable=game_value_text,
+                                            font=FONT_BODY)
+    game_current_value_label.pack(anchor='center')
 
     state.enable_game_audio_var = tk.BooleanVar(value=state.enable_game_audio)
     enable_game_audio_switch = ctk.CTkSwitch(master=game_audio_column, text="Enable",
                                              variable=state.enable_game_audio_var,
-                                             font=("Calibri", 14), command=state.mark_dirty)
+                                             font=FONT_BODY, command=state.mark_dirty)
     enable_game_audio_switch.pack(pady=8, anchor='center')
 
     # Note about exclusive audio mode
@@ -274,21 +273,20 @@ def build_preferences_tab(parent_frame):
                               text="Note: Some games use exclusive audio mode and won't reflect changes\n"
                                    "in Windows Volume Mixer. Vapor will still set the volume for these\n"
                                    "games, but further adjustments require restarting the game.",
-                              font=("Calibri", 12), text_color="gray50", justify="center", wraplength=400)
+                              font=FONT_NOTE, text_color="gray50", justify="center", wraplength=400)
     audio_note.pack(pady=(15, 5), anchor='center')
 
     # =========================================================================
     # Power Management Section
     # =========================================================================
-    pref_sep3 = ctk.CTkFrame(master=pref_scroll_frame, height=2, fg_color="gray50")
-    pref_sep3.pack(fill="x", padx=40, pady=15)
+    build_separator(pref_scroll_frame)
 
-    power_title = ctk.CTkLabel(master=pref_scroll_frame, text="Power Management", font=("Calibri", 17, "bold"))
+    power_title = ctk.CTkLabel(master=pref_scroll_frame, text="Power Management", font=FONT_SECTION)
     power_title.pack(pady=(10, 5), anchor='center')
 
     power_hint = ctk.CTkLabel(master=pref_scroll_frame,
                               text="Automatically switch power plans when gaming starts and ends.",
-                              font=("Calibri", 12), text_color="gray60")
+                              font=FONT_NOTE, text_color="gray60")
     power_hint.pack(pady=(0, 10), anchor='center')
 
     power_frame = ctk.CTkFrame(master=pref_scroll_frame, fg_color="transparent")
@@ -298,7 +296,7 @@ def build_preferences_tab(parent_frame):
     during_power_column = ctk.CTkFrame(master=power_frame, fg_color="transparent")
     during_power_column.pack(side="left", padx=40)
 
-    during_power_label = ctk.CTkLabel(master=during_power_column, text="While Gaming", font=("Calibri", 15, "bold"))
+    during_power_label = ctk.CTkLabel(master=during_power_column, text="While Gaming", font=FONT_HEADING)
     during_power_label.pack(anchor='center')
 
     state.during_power_var = tk.StringVar(value=state.during_power_plan)
@@ -310,14 +308,14 @@ def build_preferences_tab(parent_frame):
     state.enable_during_power_var = tk.BooleanVar(value=state.enable_during_power)
     enable_during_power_switch = ctk.CTkSwitch(master=during_power_column, text="Enable",
                                                variable=state.enable_during_power_var,
-                                               font=("Calibri", 14), command=state.mark_dirty)
+                                               font=FONT_BODY, command=state.mark_dirty)
     enable_during_power_switch.pack(pady=8, anchor='center')
 
     # After Gaming column
     after_power_column = ctk.CTkFrame(master=power_frame, fg_color="transparent")
     after_power_column.pack(side="left", padx=40)
 
-    after_power_label = ctk.CTkLabel(master=after_power_column, text="After Gaming", font=("Calibri", 15, "bold"))
+    after_power_label = ctk.CTkLabel(master=after_power_column, text="After Gaming", font=FONT_HEADING)
     after_power_label.pack(anchor='center')
 
     state.after_power_var = tk.StringVar(value=state.after_power_plan)
@@ -329,21 +327,20 @@ def build_preferences_tab(parent_frame):
     state.enable_after_power_var = tk.BooleanVar(value=state.enable_after_power)
     enable_after_power_switch = ctk.CTkSwitch(master=after_power_column, text="Enable",
                                               variable=state.enable_after_power_var,
-                                              font=("Calibri", 14), command=state.mark_dirty)
+                                              font=FONT_BODY, command=state.mark_dirty)
     enable_after_power_switch.pack(pady=8, anchor='center')
 
     # =========================================================================
     # Game Mode Section
     # =========================================================================
-    pref_sep4 = ctk.CTkFrame(master=pref_scroll_frame, height=2, fg_color="gray50")
-    pref_sep4.pack(fill="x", padx=40, pady=15)
+    build_separator(pref_scroll_frame)
 
-    game_mode_title = ctk.CTkLabel(master=pref_scroll_frame, text="Windows Game Mode", font=("Calibri", 17, "bold"))
+    game_mode_title = ctk.CTkLabel(master=pref_scroll_frame, text="Windows Game Mode", font=FONT_SECTION)
     game_mode_title.pack(pady=(10, 5), anchor='center')
 
     game_mode_hint = ctk.CTkLabel(master=pref_scroll_frame,
                                   text="Control Windows Game Mode automatically during gaming sessions.",
-                                  font=("Calibri", 12), text_color="gray60")
+                                  font=FONT_NOTE, text_color="gray60")
     game_mode_hint.pack(pady=(0, 10), anchor='center')
 
     game_mode_frame = ctk.CTkFrame(master=pref_scroll_frame, fg_color="transparent")
@@ -351,13 +348,13 @@ def build_preferences_tab(parent_frame):
 
     state.enable_game_mode_start_var = tk.BooleanVar(value=state.enable_game_mode_start)
     enable_game_mode_start_switch = ctk.CTkSwitch(master=game_mode_frame, text="Enable Game Mode When Game Starts",
-                                                  variable=state.enable_game_mode_start_var, font=("Calibri", 14),
+                                                  variable=state.enable_game_mode_start_var, font=FONT_BODY,
                                                   command=state.mark_dirty)
     enable_game_mode_start_switch.pack(pady=5, anchor='w')
 
     state.enable_game_mode_end_var = tk.BooleanVar(value=state.enable_game_mode_end)
     enable_game_mode_end_switch = ctk.CTkSwitch(master=game_mode_frame, text="Disable Game Mode When Game Ends",
-                                                variable=state.enable_game_mode_end_var, font=("Calibri", 14),
+                                                variable=state.enable_game_mode_end_var, font=FONT_BODY,
                                                 command=state.mark_dirty)
     enable_game_mode_end_switch.pack(pady=5, anchor='w')
 
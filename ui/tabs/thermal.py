@@ -6,13 +6,17 @@ import customtkinter as ctk
 
 import ui.state as state
 from platform_utils import is_admin
-
-# Try to import temperature functions
-try:
-    from core.temperature import get_gpu_temperature, get_cpu_temperature
-    TEMP_FUNCTIONS_AVAILABLE = True
-except ImportError:
-    TEMP_FUNCTIONS_AVAILABLE = False
+from ui.constants import (
+    FONT_BODY, FONT_SECTION, FONT_DESCRIPTION, FONT_NOTE, FONT_HEADING, FONT_SMALL,
+    FONT_BODY_BOLD, FONT_TAB_TITLE, FONT_TEMPERATURE
+)
+from ui.widgets import build_separator
+
+# Temperature functions from core.temperature, imported when the tab is first selected
+# (see start_temperature_display)
+get_gpu_temperature = None
+get_cpu_temperature = None
+TEMP_FUNCTIONS_AVAILABLE = False
 
 # Module-level references for temperature display update
 _temp_update_job = None
@@ -37,6 +41,19 @@ def _get_temp_color(temp):
         return TEMP_COLOR_RED
 
 
+def _import_temperature_functions():
+    """
+    Import the temperature functions. core.temperature loads the GPU/CPU hardware
+    monitoring libraries at import, which is too slow to do before the window is shown.
+    """
+    global get_gpu_temperature, get_cpu_temperature, TEMP_FUNCTIONS_AVAILABLE
+    try:
+        from core.temperature import get_gpu_temperature, get_cpu_temperature
+        TEMP_FUNCTIONS_AVAILABLE = True
+    except ImportError:
+        TEMP_FUNCTIONS_AVAILABLE = False
+
+
 def _update_temperature_display():
     """Update the live temperature display every second."""
     global _temp_update_job, _gpu_temp_label, _cpu_temp_label
@@ -97,6 +114,61 @@ def _stop_temperature_updates():
         _temp_update_job = None
 
 
+# Alert rows shown in the Temperature Alerts section: (kind, header top padding)
+_ALERT_ROWS = (
+    ("GPU", 5),
+    ("CPU", 15),
+)
+
+
+def _build_alert_row(parent, kind, header_top_pad):
+    """
+    Build a header plus Enable / Warning / Critical row for one temperature alert.
+
+    Creates state.enable_<kind>_temp_alert_var and the matching warning/critical
+    threshold StringVars from the loaded state values.
+    """
+    prefix = kind.lower()
+
+    alert_header = ctk.CTkLabel(master=parent, text=f"{kind} Alerts", font=FONT_HEADING)
+    alert_header.pack(pady=(header_top_pad, 5), anchor='w')
+
+    alert_row = ctk.CTkFrame(master=parent, fg_color="transparent")
+    alert_row.pack(pady=5, fill='x')
+
+    enable_var = tk.BooleanVar(value=getattr(state, f'enable_{prefix}_temp_alert'))
+    setattr(state, f'enable_{prefix}_temp_alert_var', enable_var)
+    state.watch_var(enable_var)
+    warning_var = tk.StringVar(value=str(getattr(state, f'{prefix}_temp_warning_threshold')))
+    setattr(state, f'{prefix}_temp_warning_threshold_var', warning_var)
+    critical_var = tk.StringVar(value=str(getattr(state, f'{prefix}_temp_critical_threshold')))
+    setattr(state, f'{prefix}_temp_critical_threshold_var', critical_var)
+
+    # Single grid solve per row instead of packing each widget separately
+    enable_switch = ctk.CTkSwitch(master=alert_row, text="Enable", variable=enable_var, font=FONT_BODY)
+    enable_switch.grid(row=0, column=0, padx=(0, 20))
+
+    warning_label = ctk.CTkLabel(master=alert_row, text="Warning:", font=FONT_BODY)
+    warning_label.grid(row=0, column=1, padx=(0, 5))
+
+    warning_entry = ctk.CTkEntry(master=alert_row, textvariable=warning_var, width=50, font=FONT_BODY)
+    warning_entry.grid(row=0, column=2, padx=(0, 3))
+    warning_entry.bind("<KeyRelease>", state.mark_dirty)
+
+    warning_unit = ctk.CTkLabel(master=alert_row, text="°C", font=FONT_BODY)
+    warning_unit.grid(row=0, column=3, padx=(0, 15))
+
+    critical_label = ctk.CTkLabel(master=alert_row, text="Critical:", font=FONT_BODY, text_color="#ff6b6b")
+    critical_label.grid(row=0, column=4, padx=(0, 5))
+
+    critical_entry = ctk.CTkEntry(master=alert_row, textvariable=critical_var, width=50, font=FONT_BODY)
+    critical_entry.grid(row=0, column=5, padx=(0, 3))
+    critical_entry.bind("<KeyRelease>", state.mark_dirty)
+
+    critical_unit = ctk.CTkLabel(master=alert_row, text="°C", font=FONT_BODY)
+    critical_unit.grid(row=0, column=6)
+
+
 def build_thermal_tab(parent_frame):
     """
     Build the Thermal tab content.
@@ -112,27 +184,26 @@ def build_thermal_tab(parent_frame):
     thermal_scroll_frame = ctk.CTkScrollableFrame(master=parent_frame, fg_color="transparent")
     thermal_scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-    thermal_main_title = ctk.CTkLabel(master=thermal_scroll_frame, text="Thermal Management", font=("Calibri", 25, "bold"))
+    thermal_main_title = ctk.CTkLabel(master=thermal_scroll_frame, text="Thermal Management", font=FONT_TAB_TITLE)
     thermal_main_title.pack(pady=(10, 5), anchor='center')
 
     thermal_main_description = ctk.CTkLabel(master=thermal_scroll_frame,
                                             text="Monitor and track CPU and GPU temperatures during gaming sessions.",
-                                            font=("Calibri", 13), text_color="gray60")
+                                            font=FONT_DESCRIPTION, text_color="gray60")
     thermal_main_description.pack(pady=(0, 15), anchor='center')
 
     # ==========================================================================
     # Current Temperatures Section (Live Display)
     # ==========================================================================
-    thermal_sep0 = ctk.CTkFrame(master=thermal_scroll_frame, height=2, fg_color="gray50")
-    thermal_sep0.pack(fill="x", padx=40, pady=10)
+    build_separator(thermal_scroll_frame, pady=10)
 
     current_temps_title = ctk.CTkLabel(master=thermal_scroll_frame, text="Current Temperatures",
-                                        font=("Calibri", 17, "bold"))
+                                        font=FONT_SECTION)
     current_temps_title.pack(pady=(10, 5), anchor='center')
 
     current_temps_hint = ctk.CTkLabel(master=thermal_scroll_frame,
                                        text="Live readings updated every second.",
-                                       font=("Calibri", 12), text_color="gray60")
+                                       font=FONT_NOTE, text_color="gray60")
     current_temps_hint.pack(pady=(0, 10), anchor='center')
 
     # Temperature display frame
@@ -143,161 +214,96 @@ def build_thermal_tab(parent_frame):
     gpu_display_frame = ctk.CTkFrame(master=current_temps_frame, fg_color="transparent")
     gpu_display_frame.pack(side='left', padx=30)
 
-    gpu_icon_label = ctk.CTkLabel(master=gpu_display_frame, text="GPU", font=("Calibri", 14, "bold"))
+    gpu_icon_label = ctk.CTkLabel(master=gpu_display_frame, text="GPU", font=FONT_BODY_BOLD)
     gpu_icon_label.pack()
 
-    _gpu_temp_label = ctk.CTkLabel(master=gpu_display_frame, text="--", font=("Calibri", 32, "bold"),
+    _gpu_temp_label = ctk.CTkLabel(master=gpu_display_frame, text="--", font=FONT_TEMPERATURE,
                                     text_color="gray50")
     _gpu_temp_label.pack()
 
     _gpu_temp_status = ctk.CTkLabel(master=gpu_display_frame, text="(disabled)",
-                                     font=("Calibri", 11), text_color="gray50")
+                                     font=FONT_SMALL, text_color="gray50")
     _gpu_temp_status.pack()
 
     # CPU Temperature display
     cpu_display_frame = ctk.CTkFrame(master=current_temps_frame, fg_color="transparent")
     cpu_display_frame.pack(side='left', padx=30)
 
-    cpu_icon_label = ctk.CTkLabel(master=cpu_display_frame, text="CPU", font=("Calibri", 14, "bold"))
+    cpu_icon_label = ctk.CTkLabel(master=cpu_display_frame, text="CPU", font=FONT_BODY_BOLD)
     cpu_icon_label.pack()
 
-    _cpu_temp_label = ctk.CTkLabel(master=cpu_display_frame, text="--", font=("Calibri", 32, "bold"),
+    _cpu_temp_label = ctk.CTkLabel(master=cpu_display_frame, text="--", font=FONT_TEMPERATURE,
                                     text_color="gray50")
     _cpu_temp_label.pack()
 
     _cpu_temp_status = ctk.CTkLabel(master=cpu_display_frame, text="(disabled)",
-                                     font=("Calibri", 11), text_color="gray50")
+                                     font=FONT_SMALL, text_color="gray50")
     _cpu_temp_status.pack()
 
-    thermal_sep1 = ctk.CTkFrame(master=thermal_scroll_frame, height=2, fg_color="gray50")
-    thermal_sep1.pack(fill="x", padx=40, pady=10)
+    build_separator(thermal_scroll_frame, pady=10)
 
     # Temperature Monitoring Section
-    thermal_title = ctk.CTkLabel(master=thermal_scroll_frame, text="Temperature Monitoring", font=("Calibri", 17, "bold"))
+    thermal_title = ctk.CTkLabel(master=thermal_scroll_frame, text="Temperature Monitoring", font=FONT_SECTION)
     thermal_title.pack(pady=(10, 5), anchor='center')
 
     thermal_hint = ctk.CTkLabel(master=thermal_scroll_frame,
                                 text="Track maximum CPU and GPU temperatures during gaming sessions.",
-                                font=("Calibri", 12), text_color="gray60")
+                                font=FONT_NOTE, text_color="gray60")
     thermal_hint.pack(pady=(0, 10), anchor='center')
 
     thermal_frame = ctk.CTkFrame(master=thermal_scroll_frame, fg_color="transparent")
     thermal_frame.pack(pady=10, anchor='center')
 
     state.enable_gpu_thermal_var = tk.BooleanVar(value=state.enable_gpu_thermal)
+    state.watch_var(state.enable_gpu_thermal_var)
     enable_gpu_thermal_switch = ctk.CTkSwitch(master=thermal_frame, text="Capture GPU Temperature",
-                                              variable=state.enable_gpu_thermal_var, font=("Calibri", 14),
-                                              command=state.mark_dirty)
+                                              variable=state.enable_gpu_thermal_var, font=FONT_BODY)
     enable_gpu_thermal_switch.pack(pady=5, anchor='w')
 
     state.enable_cpu_thermal_var = tk.BooleanVar(value=state.enable_cpu_thermal)
+    state.watch_var(state.enable_cpu_thermal_var)
     enable_cpu_thermal_switch = ctk.CTkSwitch(master=thermal_frame, text="Capture CPU Temperature",
-                                              variable=state.enable_cpu_thermal_var, font=("Calibri", 14),
-                                              command=state.mark_dirty)
+                                              variable=state.enable_cpu_thermal_var, font=FONT_BODY)
     enable_cpu_thermal_switch.pack(pady=(5, 0), anchor='w')
 
     cpu_thermal_note = ctk.CTkLabel(master=thermal_frame, text="(requires admin, will auto-install driver)",
-                                    font=("Calibri", 12), text_color="gray60")
+                                    font=FONT_NOTE, text_color="gray60")
     cpu_thermal_note.pack(pady=(0, 5), anchor='w', padx=(67, 0))  # Indent to align with switch text
 
     # Temperature Alerts Section
-    thermal_sep2 = ctk.CTkFrame(master=thermal_scroll_frame, height=2, fg_color="gray50")
-    thermal_sep2.pack(fill="x", padx=40, pady=15)
+    build_separator(thermal_scroll_frame)
 
-    thermal_alerts_title = ctk.CTkLabel(master=thermal_scroll_frame, text="Temperature Alerts", font=("Calibri", 17, "bold"))
+    thermal_alerts_title = ctk.CTkLabel(master=thermal_scroll_frame, text="Temperature Alerts", font=FONT_SECTION)
     thermal_alerts_title.pack(pady=(10, 5), anchor='center')
 
     thermal_alerts_hint = ctk.CTkLabel(master=thermal_scroll_frame,
                                        text="Get notified when temperatures exceed thresholds during gaming.\n"
                                             "Warning alerts are silent. Critical alerts play a sound.",
-                                       font=("Calibri", 12), text_color="gray60", justify="center")
+                                       font=FONT_NOTE, text_color="gray60", justify="center")
     thermal_alerts_hint.pack(pady=(0, 10), anchor='center')
 
     thermal_alerts_frame = ctk.CTkFrame(master=thermal_scroll_frame, fg_color="transparent")
     thermal_alerts_frame.pack(pady=10, anchor='center')
 
-    # GPU Temperature Alerts
-    gpu_alert_header = ctk.CTkLabel(master=thermal_alerts_frame, text="GPU Alerts", font=("Calibri", 15, "bold"))
-    gpu_alert_header.pack(pady=(5, 5), anchor='w')
-
-    gpu_alert_row = ctk.CTkFrame(master=thermal_alerts_frame, fg_color="transparent")
-    gpu_alert_row.pack(pady=5, fill='x')
-
-    state.enable_gpu_temp_alert_var = tk.BooleanVar(value=state.enable_gpu_temp_alert)
-    enable_gpu_temp_alert_switch = ctk.CTkSwitch(master=gpu_alert_row, text="Enable",
-                                                  variable=state.enable_gpu_temp_alert_var, font=("Calibri", 14),
-                                                  command=state.mark_dirty)
-    enable_gpu_temp_alert_switch.pack(side='left', padx=(0, 20))
-
-    gpu_warning_label = ctk.CTkLabel(master=gpu_alert_row, text="Warning:", font=("Calibri", 14))
-    gpu_warning_label.pack(side='left', padx=(0, 5))
-
-    state.gpu_temp_warning_threshold_var = tk.StringVar(value=str(state.gpu_temp_warning_threshold))
-    gpu_warning_entry = ctk.CTkEntry(master=gpu_alert_row, textvariable=state.gpu_temp_warning_threshold_var,
-                                      width=50, font=("Calibri", 14))
-    gpu_warning_entry.pack(side='left', padx=(0, 3))
-    gpu_warning_entry.bind("<KeyRelease>", state.mark_dirty)
-
-    gpu_warning_unit = ctk.CTkLabel(master=gpu_alert_row, text="°C", font=("Calibri", 14))
-    gpu_warning_unit.pack(side='left', padx=(0, 15))
-
-    gpu_critical_label = ctk.CTkLabel(master=gpu_alert_row, text="Critical:", font=("Calibri", 14), text_color="#ff6b6b")
-    gpu_critical_label.pack(side='left', padx=(0, 5))
-
-    state.gpu_temp_critical_threshold_var = tk.StringVar(value=str(state.gpu_temp_critical_threshold))
-    gpu_critical_entry = ctk.CTkEntry(master=gpu_alert_row, textvariable=state.gpu_temp_critical_threshold_var,
-                                       width=50, font=("Calibri", 14))
-    gpu_critical_entry.pack(side='left', padx=(0, 3))
-    gpu_critical_entry.bind("<KeyRelease>", state.mark_dirty)
-
-    gpu_critical_unit = ctk.CTkLabel(master=gpu_alert_row, text="°C", font=("Calibri", 14))
-    gpu_critical_unit.pack(side='left')
-
-    # CPU Temperature Alerts
-    cpu_alert_header = ctk.CTkLabel(master=thermal_alerts_frame, text="CPU Alerts", font=("Calibri", 15, "bold"))
-    cpu_alert_header.pack(pady=(15, 5), anchor='w')
-
-    cpu_alert_row = ctk.CTkFrame(master=thermal_alerts_frame, fg_color="transparent")
-    cpu_alert_row.pack(pady=5, fill='x')
-
-    state.enable_cpu_temp_alert_var = tk.BooleanVar(value=state.enable_cpu_temp_alert)
-    enable_cpu_temp_alert_switch = ctk.CTkSwitch(master=cpu_alert_row, text="Enable",
-                                                  variable=state.enable_cpu_temp_alert_var, font=("Calibri", 14),
-                                                  command=state.mark_dirty)
-    enable_cpu_temp_alert_switch.pack(side='left', padx=(0, 20))
-
-    cpu_warning_label = ctk.CTkLabel(master=cpu_alert_row, text="Warning:", font=("Calibri", 14))
-    cpu_warning_label.pack(side='left', padx=(0, 5))
-
-    state.cpu_temp_warning_threshold_var = tk.StringVar(value=str(state.cpu_temp_warning_threshold))
-    cpu_warning_entry = ctk.CTkEntry(master=cpu_alert_row, textvariable=state.cpu_temp_warning_threshold_var,
-                                      width=50, font=("Calibri", 14))
-    cpu_warning_entry.pack(side='left', padx=(0, 3))
-    cpu_warning_entry.bind("<KeyRelease>", state.mark_dirty)
-
-    cpu_warning_unit = ctk.CTkLabel(master=cpu_alert_row, text="°C", font=("Calibri", 14))
-    cpu_warning_unit.pack(side='left', padx=(0, 15))
-
-    cpu_critical_label = ctk.CTkLabel(master=cpu_alert_row, text="Critical:", font=("Calibri", 14), text_color="#ff6b6b")
-    cpu_critical_label.pack(side='left', padx=(0, 5))
-
-    state.cpu_temp_critical_threshold_var = tk.StringVar(value=str(state.cpu_temp_critical_threshold))
-    cpu_critical_entry = ctk.CTkEntry(master=cpu_alert_row, textvariable=state.cpu_temp_critical_threshold_var,
-                                       width=50, font=("Calibri", 14))
-    cpu_critical_entry.pack(side='left', padx=(0, 3))
-    cpu_critical_entry.bind("<KeyRelease>", state.mark_dirty)
-
-    cpu_critical_unit = ctk.CTkLabel(master=cpu_alert_row, text="°C", font=("Calibri", 14))
-    cpu_critical_unit.pack(side='left')
+    # GPU and CPU alert rows share one layout
+    for kind, header_top_pad in _ALERT_ROWS:
+        _build_alert_row(thermal_alerts_frame, kind, header_top_pad)
 
     thermal_alerts_note = ctk.CTkLabel(master=thermal_alerts_frame,
                                        text="Each alert level triggers once per gaming session.",
-                                       font=("Calibri", 11), text_color="gray60")
+                                       font=FONT_SMALL, text_color="gray60")
     thermal_alerts_note.pack(pady=(15, 0), anchor='w')
 
-    # Start the live temperature update loop
-    if TEMP_FUNCTIONS_AVAILABLE:
-        # Initial update after a short delay (let UI finish building)
-        state.root.after(500, _update_temperature_display)
-
     return {}
+
+
+def start_temperature_display():
+    """
+    Start the live temperature update loop. Called the first time the Thermal tab is
+    selected - the tab's widgets are built at startup, but the hardware libraries are
+    only imported once the readout is actually shown.
+    """
+    _import_temperature_functions()
+    if TEMP_FUNCTIONS_AVAILABLE:
+        # First update once the tab switch has been drawn
+        state.root.after_idle(_update_temperature_display)
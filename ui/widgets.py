@@ -0,0 +1,114 @@
+# ui/widgets.py
+# Shared widget builders for the Settings UI tabs.
+
+import functools
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+import customtkinter as ctk
+from PIL import Image
+
+import ui.state as state
+from ui.constants import FONT_BODY, FONT_LARGE
+
+# Icon path -> Future of the decoded PIL image (see prefetch_icons)
+_icon_executor = None
+_decoded_icons = {}
+
+# How often a row waiting on a background decode checks it again
+ICON_POLL_MS = 50
+
+
+def _decode_icon(icon_path):
+    """Open and fully decode an image file (Image.open alone is lazy)."""
+    image = Image.open(icon_path)
+    image.load()
+    return image
+
+
+def prefetch_icons(icon_paths):
+    """
+    Start decoding icons on worker threads so the PNG decompression overlaps
+    with window and widget construction. Only the decode runs off the main
+    thread - the CTkImage itself is still created by get_app_icon on the Tk thread.
+    """
+    global _icon_executor
+    if _icon_executor is None:
+        _icon_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="vapor-icon")
+    for icon_path in icon_paths:
+        if icon_path not in _decoded_icons:
+            _decoded_icons[icon_path] = _icon_executor.submit(_decode_icon, icon_path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_app_icon(icon_path, size=(26, 26)):
+    """
+    Load an icon as a CTkImage, decoding each file only once per session.
+    Rows and tabs that show the same path at the same size share one instance.
+    Returns None if the icon file is missing or unreadable.
+    """
+    try:
+        future = _decoded_icons.get(icon_path)
+        image = future.result() if future is not None else _decode_icon(icon_path)
+        return ctk.CTkImage(light_image=image, size=size)
+    except OSError:
+        return None
+
+
+def build_separator(master, pady=15):
+    """Pack a thin horizontal rule between sections of a tab."""
+    separator = ctk.CTkFrame(master=master, height=2, fg_color="gray50")
+    separator.pack(fill="x", padx=40, pady=pady)
+    return separator
+
+
+def _attach_icon(icon_label, icon_path):
+    """Swap a row's placeholder for its icon. Missing icons keep the placeholder."""
+    future = _decoded_icons.get(icon_path)
+    if future is not None and not future.done():
+        # Still decoding on a worker thread - poll from the Tk thread rather than block it
+        icon_label.after(ICON_POLL_MS, _attach_icon, icon_label, icon_path)
+        return
+    ctk_image = get_app_icon(icon_path)
+    if ctk_image is not None and icon_label.winfo_exists():
+        icon_label.configure(image=ctk_image, text="")
+
+
+def build_app_row(master, display_name, icon_path, selected_apps, switch_vars):
+    """
+    Build one icon + switch row for a built-in app. The icon and switch are gridded
+    straight into the column frame as its next row - a wrapper frame per row would
+    add a canvas-backed widget for every app.
+
+    Args:
+        master: Column frame to add the row to (laid out with grid only)
+        display_name: App name shown on the switch (and saved in settings)
+        icon_path: Path to the app's icon image
+        selected_apps: Set of display names currently enabled in settings
+        switch_vars: Dict to register the row's BooleanVar in (keyed by display name)
+    """
+    row = master.grid_size()[1]
+
+    # Placeholder first - the icon is attached from an idle callback, so building the
+    # rows never waits on image decoding
+    icon_label = ctk.CTkLabel(master=master, text="*", width=26, font=FONT_LARGE)
+    icon_label.grid(row=row, column=0, padx=5, pady=6)
+    icon_label.after_idle(_attach_icon, icon_label, icon_path)
+
+    var = tk.BooleanVar(value=display_name in selected_apps)
+    switch_vars[display_name] = var
+    switch = ctk.CTkSwitch(master=master, text=display_name, variable=var, font=FONT_BODY,
+                           command=state.mark_dirty)
+    switch.grid(row=row, column=1, pady=6, sticky='w')
+
+
+def set_all_switches(switch_vars, value):
+    """
+    Set every switch variable in switch_vars to value in one Tcl script rather than a
+    get/set round-trip per variable. Variables already at value are skipped, since
+    each write fires the switch's trace and redraws it.
+    """
+    if not switch_vars:
+        return
+    names = ' '.join(str(var) for var in switch_vars.values())
+    value = int(bool(value))
+    state.root.tk.eval(f'foreach name {{{names}}} {{if {{[set ::$name] != {value}}} {{set ::$name {value}}}}}')
@@ -1,13 +1,34 @@
 # updater.py
 # Handles automatic updates for Vapor via GitHub releases through a Cloudflare proxy.
 
-import requests
+import functools
+import hashlib
+import platform
+import shutil
 import subprocess
+import json
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
+import threading
+import traceback
 import time
+import uuid
 import sys
 import os
 
+from utils.constants import appdata_dir
+from utils.logging import log as _shared_log, flush_logs
+from utils.settings import get_setting
+
+# Fast JSON parsing for release metadata via orjson (falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -28,52 +49,62 @@ HEADERS = {
     "X-Vapor-Auth": "ombxslvdyyqvlkiiogwmjlkpocwqufaa"
 }
 
+# Download timeouts in seconds: (connect, read) - fail fast on connect, allow slow reads
+DOWNLOAD_TIMEOUT = (10, 30)
+
+# Copy buffer for streaming update downloads to disk (1 MB)
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Shared HTTP session, created on first use by _get_session()
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Base delay in seconds for exponential backoff after a failed update check
+UPDATE_RETRY_BASE_DELAY = 60
+
 # Telemetry heartbeat interval in seconds (1 hour = 3600, can be changed to 12h or 24h later)
 HEARTBEAT_INTERVAL = 3600
 
 # Tracks downloaded update waiting to be applied
 pending_update_path = None
 
+# Single worker for update downloads so a slow link never stalls the periodic check
+_DL_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vapor-dl")
+_download_future = None
+
+# (asset URL, ETag) of the verified download staged as vapor_new.exe, used to skip
+# re-downloading it. Kept next to the staged exe so it survives a restart before the
+# update is applied (e.g. quitting Vapor during the restart countdown).
+_staged_asset_etag = None
+_staged_asset_etag_loaded = False
+
+# Vapor's shutdown event (registered by periodic_update_check) - interrupts the restart delay
+_update_stop_event = None
+
+# Current game's Steam AppID callback (registered by periodic_update_check) - a game may
+# have started while an update was downloading
+_get_current_app_id = None
+
+# Lets request_update_check() and shutdown interrupt periodic_update_check's wait
+_schedule_cv = threading.Condition()
+_check_requested = False
+_update_checker_running = False
+
+# Print full tracebacks for unexpected errors (set VAPOR_DEBUG=1, or enable Debug Mode in Preferences)
+_DEBUG = os.environ.get("VAPOR_DEBUG") == "1"
+
 
 # =============================================================================
 # Logging
 # =============================================================================
 
-# Log file for debugging (stored in %APPDATA%/Vapor)
-_appdata_dir = os.path.join(os.getenv('APPDATA', ''), 'Vapor')
-os.makedirs(_appdata_dir, exist_ok=True)
-DEBUG_LOG_FILE = os.path.join(_appdata_dir, 'vapor_logs.log')
-
-# Maximum log file size (2 MB) - will be truncated when exceeded
-MAX_LOG_SIZE = 2 * 1024 * 1024
+# Log lines go through the shared Vapor logger (utils.logging), which batches
+# writes from every module into one open file handle
 
 
 def log(message, category="UPDATE"):
     """Print timestamped log message and write to log file."""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    formatted = f"[{timestamp}] [{category}] {message}"
-
-    # Print to console (if available)
-    try:
-        print(formatted)
-    except (OSError, ValueError):
-        pass
-
-    # Also write to log file
-    try:
-        # Check if log file is too large and truncate if needed
-        if os.path.exists(DEBUG_LOG_FILE):
-            if os.path.getsize(DEBUG_LOG_FILE) > MAX_LOG_SIZE:
-                # Keep last 500 lines
-                with open(DEBUG_LOG_FILE, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()[-500:]
-                with open(DEBUG_LOG_FILE, 'w', encoding='utf-8') as f:
-                    f.writelines(lines)
-
-        with open(DEBUG_LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(f"{formatted}\n")
-    except Exception:
-        pass
+    _shared_log(message, category)
 
 
 # =============================================================================
@@ -81,27 +112,55 @@ def log(message, category="UPDATE"):
 # =============================================================================
 
 
+def _log_exception(context, exc):
+    """
+    Log an exception through the batched log path.
+    Only the one-line summary is formatted normally; the full traceback is
+    formatted on demand when VAPOR_DEBUG=1 or the enable_debug_mode setting is on.
+    """
+    summary = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+    log(f"{context}: {summary}", "ERROR")
+    if _DEBUG or get_setting('enable_debug_mode', False):
+        log(traceback.format_exc().rstrip(), "ERROR")
+
+
 def is_development_mode():
     """Check if running from source (not compiled .exe)."""
     return not getattr(sys, 'frozen', False)
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_version(version):
+    """
+    Parse a version string like 'v1.2.3' into a tuple of ints (cached).
+    Trailing zero components are dropped so '1.2' and '1.2.0' compare equal.
+    """
+    parts = [int(part) for part in version.lstrip('v').split('.')]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+# CURRENT_VERSION never changes - parse it once at import
+_CURRENT_VERSION_TUPLE = _parse_version(CURRENT_VERSION)
+
+
 def compare_versions(version1, version2):
     """
     Compare semantic versions (e.g., '1.2.3' vs '1.2.2').
     Returns: 1 if v1 > v2, -1 if v1 < v2, 0 if equal.
     """
-    v1 = list(map(int, version1.lstrip('v').split('.')))
-    v2 = list(map(int, version2.lstrip('v').split('.')))
+    v1 = _parse_version(version1)
+    v2 = _parse_version(version2)
 
-    for a, b in zip(v1, v2):
-        if a > b:
-            return 1
-        if a < b:
-            return -1
+    # Branchless: a single C-level tuple comparison, which also orders
+    # different lengths correctly (e.g., 1.2 < 1.2.1)
+    return (v1 > v2) - (v1 < v2)
 
-    # Handle different version lengths (e.g., 1.2 vs 1.2.1)
-    return 0 if len(v1) == len(v2) else (1 if len(v1) > len(v2) else -1)
+
+def is_newer_version(version):
+    """Return True if version is newer than the running CURRENT_VERSION."""
+    return _parse_version(version) > _CURRENT_VERSION_TUPLE
 
 
 # =============================================================================
@@ -109,31 +168,40 @@ def compare_versions(version1, version2):
 # =============================================================================
 
 # File to store unique installation ID
-INSTALL_ID_FILE = os.path.join(_appdata_dir, 'install_id')
+INSTALL_ID_FILE = os.path.join(appdata_dir, 'install_id')
+
+# Install ID once read or created (it never changes while Vapor runs)
+_install_id = None
 
 
 def _get_or_create_install_id():
-    """Get existing install ID or create a new one."""
-    import uuid
+    """Get existing install ID or create a new one (cached after the first success)."""
+    global _install_id
+    if _install_id:
+        return _install_id
     try:
-        if os.path.exists(INSTALL_ID_FILE):
+        try:
             with open(INSTALL_ID_FILE, 'r') as f:
                 install_id = f.read().strip()
-                if install_id:
-                    return install_id
+            if install_id:
+                _install_id = install_id
+                return install_id
+        except FileNotFoundError:
+            pass
 
         # Generate new UUID for this installation
         install_id = str(uuid.uuid4())
         with open(INSTALL_ID_FILE, 'w') as f:
             f.write(install_id)
+        _install_id = install_id
         return install_id
     except Exception:
         return "unknown"
 
 
+@functools.lru_cache(maxsize=1)
 def _get_os_info():
-    """Get basic OS information."""
-    import platform
+    """Get basic OS information (cached - it cannot change while Vapor runs)."""
     try:
         return f"{platform.system()} {platform.release()}"
     except Exception:
@@ -154,11 +222,8 @@ def send_telemetry(event="app_start"):
     No personal information is collected.
     Telemetry can be disabled in Settings > Preferences.
     """
-    import threading
-
     # Check if telemetry is enabled in settings
     try:
-        from utils.settings import get_setting
         if not get_setting('enable_telemetry', True):
             log("Telemetry disabled by user setting", "TELEMETRY")
             return
@@ -177,9 +242,8 @@ def send_telemetry(event="app_start"):
                 payload["version"] = CURRENT_VERSION
                 payload["os"] = _get_os_info()
 
-            response = requests.post(
+            response = _get_session().post(
                 f"{PROXY_BASE_URL}/telemetry",
-                headers=HEADERS,
                 json=payload,
                 timeout=5
             )
@@ -196,11 +260,127 @@ def send_telemetry(event="app_start"):
     threading.Thread(target=_send, daemon=True).start()
 
 
+# =============================================================================
+# Release Metadata Cache
+# =============================================================================
+
+# Validators from the last "already up to date" response (stored in %APPDATA%/Vapor)
+UPDATE_CACHE_FILE = os.path.join(appdata_dir, 'update_cache.json')
+_last_etag = None
+_last_modified = None
+_last_checked = 0.0
+_update_cache_loaded = False
+
+# Seconds after an "already up to date" answer during which the release is not
+# re-requested at all (covers quick restarts and back-to-back checks)
+UPDATE_CACHE_TTL = 600
+
+
+def _load_update_cache():
+    """Load cached ETag/Last-Modified validators from disk (once per session)."""
+    global _last_etag, _last_modified, _last_checked, _update_cache_loaded
+    if _update_cache_loaded:
+        return
+    _update_cache_loaded = True
+    try:
+        with open(UPDATE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        # Validators recorded by a different Vapor version say nothing about this one
+        if cache.get("version") != CURRENT_VERSION:
+            return
+        _last_etag = cache.get("etag")
+        _last_modified = cache.get("last_modified")
+        _last_checked = float(cache.get("checked_at", 0))
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _save_update_cache(etag, last_modified):
+    """Remember validators so the next check can be answered with 304 Not Modified."""
+    global _last_etag, _last_modified, _last_checked
+    _last_etag = etag
+    _last_modified = last_modified
+    _last_checked = time.time()
+    try:
+        with open(UPDATE_CACHE_FILE, 'w') as f:
+            json.dump({"version": CURRENT_VERSION, "etag": etag, "last_modified": last_modified,
+                       "checked_at": _last_checked}, f)
+    except OSError:
+        pass
+
+
+def _update_cache_fresh():
+    """True if the release was confirmed up to date less than UPDATE_CACHE_TTL seconds ago."""
+    _load_update_cache()
+    return 0 <= time.time() - _last_checked < UPDATE_CACHE_TTL
+
+
+def _conditional_headers():
+    """Return HEADERS plus If-None-Match/If-Modified-Since for the cached release."""
+    _load_update_cache()
+    headers = dict(HEADERS)
+    if _last_etag:
+        headers["If-None-Match"] = _last_etag
+    if _last_modified:
+        headers["If-Modified-Since"] = _last_modified
+    return headers
+
+
 # =============================================================================
 # Update Check & Download
 # =============================================================================
 
-def check_for_updates(current_app_id=None, show_notification_func=None):
+def _get_session():
+    """
+    Return the shared HTTP session, importing requests on first use.
+
+    requests (with urllib3 and the certifi CA bundle) is only needed by the
+    background update/telemetry threads, so it is kept off the startup path.
+    The session keeps the TLS connection to the proxy alive between the
+    release check and the asset download, and retries transient 5xx
+    responses. 429 is not retried here - it is returned as is, so
+    periodic_update_check can honour Retry-After without blocking this thread.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            session.mount("https://", HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=4,
+                max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504],
+                                  respect_retry_after_header=False, raise_on_status=False)
+            ))
+            _SESSION = session
+        return _SESSION
+
+
+def _server_retry_delay(response):
+    """
+    Seconds the server asked us to wait (Retry-After or X-RateLimit-Reset), or None.
+    """
+    delays = []
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delays.append(float(retry_after))
+        except ValueError:
+            pass
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            delays.append(float(response.headers.get("X-RateLimit-Reset", "")) - time.time())
+        except ValueError:
+            pass
+    delay = max(delays, default=0)
+    return delay if delay > 0 else None
+
+
+def check_for_updates(current_app_id=None, show_notification_func=None, use_cache=True):
     """
     Check GitHub for new releases and download if available.
     Postpones installation if a game is currently running.
@@ -208,34 +388,54 @@ def check_for_updates(current_app_id=None, show_notification_func=None):
     Args:
         current_app_id: Steam AppID of running game (0 or None if no game)
         show_notification_func: Callback to display user notifications
+        use_cache: Skip the request if the release was confirmed up to date recently
+
+    Returns:
+        dict: {"success": bool, "next_check_delay": seconds the server asked us to wait, or None}
     """
-    global pending_update_path
+    global _download_future
+
+    result = {"success": True, "next_check_delay": None}
 
     if is_development_mode():
         log("Development mode - skipping update check")
-        return
+        return result
+
+    import requests
+
+    if use_cache and _update_cache_fresh():
+        log(f"Release checked recently - already up to date (v{CURRENT_VERSION})")
+        return result
 
     try:
         log(f"Checking for updates (current: v{CURRENT_VERSION})...")
         proxy_url = f"{PROXY_BASE_URL}{LATEST_RELEASE_PROXY_PATH}"
 
-        response = requests.get(proxy_url, headers=HEADERS, timeout=10)
+        response = _get_session().get(proxy_url, headers=_conditional_headers(), timeout=10)
+        if response.status_code == 304:
+            log(f"Release not modified - already up to date (v{CURRENT_VERSION})")
+            _save_update_cache(_last_etag, _last_modified)
+            return result
         if response.status_code != 200:
             log(f"Proxy returned status {response.status_code}", "ERROR")
-            return
+            result["success"] = False
+            result["next_check_delay"] = _server_retry_delay(response)
+            return result
 
         response.raise_for_status()
-        release_data = response.json()
+        release_data = _json_loads(response.content)
         latest_version = release_data.get("tag_name")
 
         if not latest_version:
             log("No version tag found in release", "ERROR")
-            return
+            return result
 
         # Compare versions to determine if update is needed
-        if compare_versions(latest_version, CURRENT_VERSION) <= 0:
+        if not is_newer_version(latest_version):
             log(f"Already up to date (v{CURRENT_VERSION})")
-            return
+            # Only cache validators for "nothing to do" - a postponed update must be re-fetched
+            _save_update_cache(response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return result
 
         log(f"Update available: v{latest_version}")
 
@@ -244,7 +444,7 @@ def check_for_updates(current_app_id=None, show_notification_func=None):
         asset = next((a for a in assets if a["name"].lower() == "vapor.exe"), None)
         if not asset:
             log("No vapor.exe found in release assets", "ERROR")
-            return
+            return result
 
         # Build download URL through proxy
         asset_api_path = asset["url"].replace("https://api.github.com", "")
@@ -255,72 +455,233 @@ def check_for_updates(current_app_id=None, show_notification_func=None):
             log(f"Game running (AppID: {current_app_id}) - postponing download")
             if show_notification_func:
                 show_notification_func(f"Update {latest_version} available! Will install after gaming.")
-            return
+            return result
+
+        # Hand the download off to the worker thread (skip if one is already in flight)
+        if _download_future is not None and not _download_future.done():
+            log("Update download already in progress")
+            return result
 
-        # Download the update
         log("Starting download...")
         if show_notification_func:
             show_notification_func(f"Downloading and installing update {latest_version}...")
 
         download_headers = {**HEADERS, "Accept": "application/octet-stream"}
-        download_response = requests.get(download_proxy_url, headers=download_headers, stream=True, timeout=30)
-        download_response.raise_for_status()
+        expected_sha256 = _get_asset_sha256(asset, assets, download_headers)
+        _download_future = _DL_POOL.submit(_download_and_stage, download_proxy_url, download_headers,
+                                           expected_sha256, show_notification_func)
+
+    except requests.exceptions.ConnectionError as e:
+        log(f"Connection error: {e}", "ERROR")
+        result["success"] = False
+    except requests.exceptions.Timeout as e:
+        log(f"Timeout error: {e}", "ERROR")
+        result["success"] = False
+    except requests.exceptions.SSLError as e:
+        log(f"SSL error: {e}", "ERROR")
+        result["success"] = False
+    except requests.RequestException as e:
+        log(f"Network error: {e}", "ERROR")
+        result["success"] = False
+    except Exception as e:
+        _log_exception("Unexpected error", e)
+
+    return result
+
+
+def _get_asset_sha256(asset, assets, download_headers):
+    """
+    Get the expected SHA-256 of the vapor.exe asset.
+
+    Uses GitHub's asset "digest" field when present, falling back to a sibling
+    vapor.exe.sha256 asset. Returns a lowercase hex digest or None.
+    """
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest[len("sha256:"):].lower()
+
+    import requests
+
+    checksum_asset = next((a for a in assets if a["name"].lower() == "vapor.exe.sha256"), None)
+    if not checksum_asset:
+        return None
+    try:
+        checksum_url = f"{PROXY_BASE_URL}{checksum_asset['url'].replace('https://api.github.com', '')}"
+        response = _get_session().get(checksum_url, headers=download_headers, timeout=10)
+        response.raise_for_status()
+        # Format: "<hex digest>  vapor.exe" (sha256sum style) or just the digest
+        return response.text.split()[0].lower()
+    except (requests.RequestException, IndexError) as e:
+        log(f"Could not fetch SHA-256 checksum: {e}", "ERROR")
+        return None
+
+
+def _sha256_file(path):
+    """Return the lowercase hex SHA-256 of a file (hashed in C by hashlib.file_digest)."""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _staged_etag_path(temp_exe_path):
+    """Path of the file recording the staged exe's (asset URL, ETag)."""
+    return temp_exe_path + ".etag"
+
+
+def _load_staged_etag(temp_exe_path):
+    """Load the staged download's (asset URL, ETag) from disk (once per session)."""
+    global _staged_asset_etag, _staged_asset_etag_loaded
+    if _staged_asset_etag_loaded:
+        return
+    _staged_asset_etag_loaded = True
+    try:
+        with open(_staged_etag_path(temp_exe_path), 'r') as f:
+            staged = json.load(f)
+        _staged_asset_etag = (staged["url"], staged["etag"])
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
 
+
+def _save_staged_etag(temp_exe_path, download_url, etag):
+    """Record (or, with no ETag, forget) the (asset URL, ETag) of the staged exe."""
+    global _staged_asset_etag, _staged_asset_etag_loaded
+    _staged_asset_etag = (download_url, etag) if etag else None
+    _staged_asset_etag_loaded = True
+    try:
+        if _staged_asset_etag:
+            with open(_staged_etag_path(temp_exe_path), 'w') as f:
+                json.dump({"url": download_url, "etag": etag}, f)
+        else:
+            os.remove(_staged_etag_path(temp_exe_path))
+    except OSError:
+        pass
+
+
+def _download_and_stage(download_url, download_headers, expected_sha256=None, show_notification_func=None):
+    """
+    Download the new vapor.exe to the temp directory and apply it.
+    Runs on the download worker thread; errors are logged, never raised.
+
+    Args:
+        expected_sha256: Lowercase hex digest to verify against (None to skip)
+    """
+    global pending_update_path
+    import requests
+
+    try:
         # Save to temp directory
         temp_dir = tempfile.gettempdir()
         temp_exe_path = os.path.join(temp_dir, "vapor_new.exe")
 
-        total_size = 0
+        # A previous download of this asset is still on disk - confirm it is unchanged
+        # with a conditional HEAD instead of downloading it again
+        _load_staged_etag(temp_exe_path)
+        if _staged_asset_etag and _staged_asset_etag[0] == download_url and os.path.exists(temp_exe_path):
+            head_response = _get_session().head(download_url, timeout=10, allow_redirects=True,
+                                                headers={**download_headers, "If-None-Match": _staged_asset_etag[1]})
+            if head_response.status_code == 304 and (
+                    not expected_sha256 or _sha256_file(temp_exe_path) == expected_sha256):
+                log("Update asset unchanged - reusing previous download")
+                pending_update_path = temp_exe_path
+                _apply_unless_gaming(show_notification_func)
+                return
+
+        download_response = _get_session().get(download_url, headers=download_headers, stream=True,
+                                               timeout=DOWNLOAD_TIMEOUT)
+        download_response.raise_for_status()
+
+        # vapor_new.exe is about to be overwritten - its recorded ETag no longer applies
+        _save_staged_etag(temp_exe_path, download_url, None)
+
         with open(temp_exe_path, "wb") as f:
-            for chunk in download_response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                total_size += len(chunk)
+            # Pre-size the file so it can be laid out contiguously
+            expected_size = int(download_response.headers.get("Content-Length") or 0)
+            if expected_size:
+                f.truncate(expected_size)
+
+            # Copy the raw stream in 1 MB blocks (the copy loop runs inside shutil)
+            download_response.raw.decode_content = True
+            shutil.copyfileobj(download_response.raw, f, DOWNLOAD_BUFFER_SIZE)
+            f.truncate()  # Drop any pre-sized tail the stream did not fill
 
-        # Verify download succeeded
-        if not os.path.exists(temp_exe_path) or os.path.getsize(temp_exe_path) == 0:
+            # Verify download succeeded (single fstat - the filesystem is the source of truth)
+            total_size = os.fstat(f.fileno()).st_size
+
+        if total_size == 0:
             log("Download failed - empty file", "ERROR")
             return
 
+        if expected_sha256:
+            if _sha256_file(temp_exe_path) != expected_sha256:
+                log("Download failed - SHA-256 mismatch, discarding file", "ERROR")
+                try:
+                    os.remove(temp_exe_path)
+                except OSError:
+                    pass
+                return
+            log("Download SHA-256 verified")
+        else:
+            log("No SHA-256 published for this release - skipping verification")
+
         log(f"Download complete: {total_size / 1024 / 1024:.2f} MB")
         pending_update_path = temp_exe_path
+        _save_staged_etag(temp_exe_path, download_url, download_response.headers.get("ETag"))
 
-        # Apply immediately if no game running, otherwise wait
-        if current_app_id and current_app_id != 0:
-            log("Game running - update will apply after gaming session")
-            if show_notification_func:
-                show_notification_func(f"Update {latest_version} ready! Will install after gaming.")
-        else:
-            log("Applying update immediately...")
-            apply_pending_update(show_notification_func)
+        _apply_unless_gaming(show_notification_func)
 
     except requests.exceptions.ConnectionError as e:
-        log(f"Connection error: {e}", "ERROR")
+        log(f"Download connection error: {e}", "ERROR")
     except requests.exceptions.Timeout as e:
-        log(f"Timeout error: {e}", "ERROR")
-    except requests.exceptions.SSLError as e:
-        log(f"SSL error: {e}", "ERROR")
+        log(f"Download timeout error: {e}", "ERROR")
     except requests.RequestException as e:
-        log(f"Network error: {e}", "ERROR")
+        log(f"Download network error: {e}", "ERROR")
     except Exception as e:
-        log(f"Unexpected error: {type(e).__name__}: {e}", "ERROR")
-        import traceback
-        traceback.print_exc()
+        _log_exception("Unexpected download error", e)
 
 
 # =============================================================================
 # Update Application
 # =============================================================================
 
+def _apply_unless_gaming(show_notification_func=None):
+    """
+    Apply the staged update now, or leave it pending if a game started during the download.
+    A pending update is applied by the game monitor once the game exits.
+    """
+    current_app_id = _get_current_app_id() if _get_current_app_id else 0
+    if current_app_id and current_app_id != 0:
+        log(f"Game running (AppID: {current_app_id}) - update will install after gaming")
+        if show_notification_func:
+            show_notification_func("Update downloaded! Will install after gaming.")
+        return
+
+    log("Applying update immediately...")
+    apply_pending_update(show_notification_func)
+
+
 def apply_pending_update(show_notification_func=None):
     """
     Apply a previously downloaded update.
     Shows notification and restarts Vapor with the new version.
+
+    Args:
+        show_notification_func: Callback to display user notifications
+
+    The 5 second delay ends early (and the update is skipped) if Vapor's
+    stop_event is set.
     """
     global pending_update_path
 
-    if not pending_update_path or not os.path.exists(pending_update_path):
+    # Single stat answers both "does it exist" and "is it non-empty"
+    update_ready = False
+    if pending_update_path:
+        try:
+            update_ready = os.stat(pending_update_path).st_size > 0
+        except FileNotFoundError:
+            pass
+
+    if not update_ready:
         if pending_update_path:
-            log("Pending update file not found - cleaning up")
+            log("Pending update file missing or empty - cleaning up")
             try:
                 os.remove(pending_update_path)
             except:
@@ -333,35 +694,20 @@ def apply_pending_update(show_notification_func=None):
     if show_notification_func:
         show_notification_func("Vapor will restart in a few seconds...")
 
-    time.sleep(5)
+    if _update_stop_event is not None:
+        # Vapor's shutdown event cuts the wait short - don't restart into an update mid-quit
+        if _update_stop_event.wait(5):
+            log("Shutdown requested - update will be applied next time")
+            return
+    else:
+        time.sleep(5)
     perform_update(pending_update_path)
     pending_update_path = None
 
 
-def perform_update(new_exe_path):
-    """
-    Execute the update by replacing the current executable.
-    Uses a VBScript wrapper to run the update batch file silently (no window flash).
-    """
-    # Determine the actual Vapor.exe path
-    # Nuitka: use sys.argv[0] for the executable path
-    if getattr(sys, 'frozen', False):
-        current_exe = sys.argv[0]
-    else:
-        current_exe = sys.executable
-    current_exe_dir = os.path.dirname(current_exe)
-    temp_dir = tempfile.gettempdir()
-    batch_path = os.path.join(temp_dir, "vapor_update.bat")
-    vbs_path = os.path.join(temp_dir, "vapor_update.vbs")
-    log_path = os.path.join(temp_dir, "vapor_update_log.txt")
-
-    log("Creating update scripts...")
-    log(f"Current exe: {current_exe}")
-    log(f"New exe: {new_exe_path}")
-
-    # Batch script: waits for Vapor to close, replaces exe, restarts
-    # Note: No leading spaces - critical for batch file syntax
-    batch_content = f'''@echo off
+# Batch script: waits for Vapor to close, replaces exe, restarts
+# Note: No leading spaces - critical for batch file syntax
+_BATCH_TEMPLATE = '''@echo off
 set attempts=0
 set max_attempts=30
 echo %date% %time% - Starting update process... > "{log_path}"
@@ -405,75 +751,155 @@ echo Launch complete. >> "{log_path}"
 
 :cleanup
 echo Cleaning up batch file... >> "{log_path}"
-del /F /Q "{vbs_path}" 2>nul
 del /F /Q "%~f0"
 '''
 
-    # VBScript wrapper: runs batch file completely hidden (no console window)
-    vbs_content = f'''Set WshShell = CreateObject("WScript.Shell")
-WshShell.Run chr(34) & "{batch_path}" & chr(34), 0, False
-Set WshShell = Nothing
-'''
 
+def _write_script(path, content):
+    """
+    Write an ASCII script file atomically with a single unbuffered write.
+    The content goes to a temp file first and is moved into place with os.replace,
+    so the updater can never run a partially written script.
+    """
+    # Binary mode with explicit CRLF - batch labels/goto misbehave with bare LF
+    data = content.encode("ascii", "replace").replace(b"\n", b"\r\n")
+    temp_path = path + ".tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(temp_path, flags, 0o644)
     try:
-        # Write update scripts
-        with open(batch_path, "w", encoding="ascii", errors="replace") as f:
-            f.write(batch_content)
-        log("Batch file created")
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(temp_path, path)
 
-        with open(vbs_path, "w", encoding="ascii", errors="replace") as f:
-            f.write(vbs_content)
-        log("VBScript wrapper created")
 
-        if not os.path.exists(batch_path) or not os.path.exists(vbs_path):
-            log("Script creation failed!", "ERROR")
-            return
+def perform_update(new_exe_path):
+    """
+    Execute the update by replacing the current executable.
+    Runs the update batch file in a hidden console (no window flash).
+    """
+    # Determine the actual Vapor.exe path
+    # Nuitka: use sys.argv[0] for the executable path
+    if getattr(sys, 'frozen', False):
+        current_exe = sys.argv[0]
+    else:
+        current_exe = sys.executable
+    current_exe_dir = os.path.dirname(current_exe)
+    temp_dir = tempfile.gettempdir()
+    batch_path = os.path.join(temp_dir, "vapor_update.bat")
+    log_path = os.path.join(temp_dir, "vapor_update_log.txt")
+
+    log("Creating update scripts...")
+    log(f"Current exe: {current_exe}")
+    log(f"New exe: {new_exe_path}")
 
-        log("Executing update via VBScript (fully hidden)...")
+    template_values = {
+        "current_exe": current_exe,
+        "current_exe_dir": current_exe_dir,
+        "new_exe_path": new_exe_path,
+        "log_path": log_path,
+    }
+    batch_content = _BATCH_TEMPLATE.format_map(template_values)
 
-        # Launch VBScript with no window
-        CREATE_NO_WINDOW = 0x08000000
+    try:
+        # Write update scripts (a failed write raises, so no re-check is needed)
+        _write_script(batch_path, batch_content)
+        log("Batch file created")
+
+        log("Executing update batch file (hidden window)...")
+
+        # Run the batch file directly in a hidden console. CREATE_NO_WINDOW (rather than
+        # DETACHED_PROCESS) gives cmd.exe a windowless console that ping/taskkill inherit,
+        # and the new process group keeps it alive after Vapor exits.
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
         subprocess.Popen(
-            ["wscript.exe", "//nologo", vbs_path],
-            creationflags=subprocess.DETACHED_PROCESS | CREATE_NO_WINDOW,
+            ["cmd.exe", "/c", batch_path],
+            startupinfo=startupinfo,
+            creationflags=subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-            stdin=subprocess.DEVNULL
+            stdin=subprocess.DEVNULL,
+            close_fds=True
         )
 
         log("Update process launched - exiting Vapor...")
         time.sleep(0.5)
+        flush_logs()
         os._exit(0)
 
     except Exception as e:
-        log(f"Update execution failed: {e}", "ERROR")
-        import traceback
-        traceback.print_exc()
+        _log_exception("Update execution failed", e)
 
 
 # =============================================================================
 # Background Update Checker
 # =============================================================================
 
+def request_update_check():
+    """
+    Make periodic_update_check run its next check now instead of at its deadline.
+
+    Returns:
+        bool: True if the update checker is running and will pick up the request
+    """
+    global _check_requested
+    with _schedule_cv:
+        if not _update_checker_running:
+            return False
+        _check_requested = True
+        _schedule_cv.notify_all()
+    return True
+
+
+def wake_update_checker():
+    """Wake periodic_update_check so it notices its stop_event has been set."""
+    with _schedule_cv:
+        _schedule_cv.notify_all()
+
+
 def periodic_update_check(stop_event, get_current_app_id_func, show_notification_func, check_interval=3600):
     """
     Background thread that periodically checks for updates and sends telemetry heartbeats.
 
     Args:
-        stop_event: Threading event to signal shutdown
+        stop_event: Threading event to signal shutdown (follow with wake_update_checker())
         get_current_app_id_func: Callback returning current game's Steam AppID
         show_notification_func: Callback to display user notifications
         check_interval: Seconds between checks (default: 1 hour)
     """
+    global _check_requested, _update_checker_running, _update_stop_event, _get_current_app_id
+    _update_stop_event = stop_event
+    _get_current_app_id = get_current_app_id_func
+
+    # Running from source never updates - don't keep an idle thread around
+    if is_development_mode():
+        log("Development mode - update checker not started")
+        return
+
     log(f"Update checker starting (first check in {check_interval // 60} minutes)...")
+    with _schedule_cv:
+        _update_checker_running = True
 
     check_count = 0
+    consecutive_failures = 0
+    next_delay = check_interval
     last_heartbeat_time = time.time()  # Track when we last sent a heartbeat
 
     while not stop_event.is_set():
-        # Wait before checking (first check waits full interval, no immediate check on startup)
-        log(f"Next check in {check_interval // 60} minutes")
-        if stop_event.wait(check_interval):
+        # Wait before checking (first check waits full interval, no immediate check on startup).
+        # request_update_check() can pull the deadline in to now.
+        log(f"Next check in {int(next_delay) // 60} minutes")
+        deadline = time.monotonic() + next_delay
+        with _schedule_cv:
+            _schedule_cv.wait_for(
+                lambda: stop_event.is_set() or _check_requested or time.monotonic() >= deadline,
+                timeout=next_delay
+            )
+            requested = _check_requested
+            _check_requested = False
+        if stop_event.is_set():
             break
 
         try:
@@ -488,8 +914,21 @@ def periodic_update_check(stop_event, get_current_app_id_func, show_notification
                 last_heartbeat_time = current_time
 
             current_app_id = get_current_app_id_func() if get_current_app_id_func else 0
-            check_for_updates(current_app_id, show_notification_func)
+            result = check_for_updates(current_app_id, show_notification_func, use_cache=not requested)
+
+            # Back off exponentially on failures, but never ignore an explicit server delay
+            if result["success"]:
+                consecutive_failures = 0
+                next_delay = check_interval
+            else:
+                consecutive_failures += 1
+                next_delay = min(check_interval, UPDATE_RETRY_BASE_DELAY * 2 ** consecutive_failures)
+            if result["next_check_delay"]:
+                next_delay = max(next_delay, result["next_check_delay"])
         except Exception as e:
             log(f"Error in periodic check: {e}", "ERROR")
+            next_delay = check_interval
 
+    with _schedule_cv:
+        _update_checker_running = False
     log("Update checker stopped")
\ No newline at end of file
@@ -9,14 +9,43 @@ from utils.constants import (
     MAX_LOG_SIZE,
     TRAY_ICON_PATH,
     PROTECTED_PROCESSES,
+    is_protected_process,
     GAME_STARTED_SIGNAL_FILE,
 )
-from utils.logging import log
-from utils.settings import (
-    DEFAULT_SETTINGS,
-    load_settings,
-    save_settings,
-    create_default_settings,
-    get_setting,
-    set_setting,
+from utils.logging import log, flush_logs
+
+# Settings helpers are imported on first access (PEP 562), so modules that only
+# need paths or log() don't load utils.settings
+_SETTINGS_NAMES = (
+    'DEFAULT_SETTINGS',
+    'load_settings',
+    'save_settings',
+    'create_default_settings',
+    'get_setting',
+    'set_setting',
+    'update_settings',
 )
+
+__all__ = [
+    'base_dir',
+    'appdata_dir',
+    'SETTINGS_FILE',
+    'DEBUG_LOG_FILE',
+    'MAX_LOG_SIZE',
+    'TRAY_ICON_PATH',
+    'PROTECTED_PROCESSES',
+    'is_protected_process',
+    'GAME_STARTED_SIGNAL_FILE',
+    'log',
+    'flush_logs',
+    *_SETTINGS_NAMES,
+]
+
+
+def __getattr__(name):
+    if name in _SETTINGS_NAMES:
+        import utils.settings
+        value = getattr(utils.settings, name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module 'utils' has no attribute {name!r}")
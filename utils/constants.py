@@ -1,6 +1,7 @@
 # utils/constants.py
 # Shared constants and paths for Vapor application
 
+import functools
 import os
 import sys
 
@@ -16,7 +17,10 @@ else:
 
 # AppData directory for persistent user data
 appdata_dir = os.path.join(os.getenv('APPDATA'), 'Vapor')
-os.makedirs(appdata_dir, exist_ok=True)
+# One stat on the common path - makedirs(exist_ok=True) stats the parent, attempts
+# mkdir and stats again after the EEXIST failure
+if not os.path.isdir(appdata_dir):
+    os.makedirs(appdata_dir, exist_ok=True)
 
 # =============================================================================
 # File Paths
@@ -38,8 +42,8 @@ MAX_LOG_SIZE = 5 * 1024 * 1024
 # Protected Processes
 # =============================================================================
 
-# System processes that should never be terminated (safety protection)
-PROTECTED_PROCESSES = {
+# System processes that should never be terminated (safety protection), case-folded
+PROTECTED_PROCESSES = frozenset({
     # Windows core
     'explorer.exe', 'svchost.exe', 'csrss.exe', 'wininit.exe', 'winlogon.exe',
     'services.exe', 'lsass.exe', 'smss.exe', 'dwm.exe', 'taskhostw.exe',
@@ -55,4 +59,10 @@ PROTECTED_PROCESSES = {
     'spoolsv.exe', 'wuauserv.exe', 'audiodg.exe',
     # Vapor itself
     'vapor.exe',
-}
+})
+
+
+@functools.lru_cache(maxsize=256)
+def is_protected_process(name):
+    """Return True if a process name (any case) is in PROTECTED_PROCESSES."""
+    return name.casefold() in PROTECTED_PROCESSES
@@ -1,10 +1,96 @@
 # utils/logging.py
 # Shared logging functionality for Vapor application
 
+import atexit
 import os
+import queue
+import threading
 import time
 from utils.constants import DEBUG_LOG_FILE, MAX_LOG_SIZE
 
+# Truncation keeps the last LOG_TAIL_LINES lines, read from at most LOG_TAIL_BYTES at the end
+LOG_TAIL_LINES = 1000
+LOG_TAIL_BYTES = 256 * 1024
+
+# Size is only checked every LOG_ROTATE_CHECK_INTERVAL writes - the threshold moves slowly
+LOG_ROTATE_CHECK_INTERVAL = 100
+
+# Log lines are queued (already UTF-8 encoded) and written in batches by a single
+# background thread that keeps the file open, instead of opening/closing it on every call
+_log_queue = queue.Queue()
+_log_writer_thread = None
+_log_writer_lock = threading.Lock()
+
+
+def _truncate_log_file():
+    """
+    Keep only the tail of the log file, reading a bounded window from the end.
+    The file is rewritten in place rather than replaced, so append handles held
+    by this writer or another Vapor process stay valid.
+    """
+    with open(DEBUG_LOG_FILE, 'r+b') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - LOG_TAIL_BYTES))
+        lines = f.read().split(b"\n")[1:]  # First line is likely partial
+        f.seek(0)
+        f.write(b"\n".join(lines[-LOG_TAIL_LINES:]))
+        f.truncate()
+
+
+def _log_writer():
+    """Drain the log queue in batches into a persistent file handle."""
+    log_file = None
+    writes_since_check = 0
+    while True:
+        batch = [_log_queue.get()]
+        while True:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        stopping = None in batch
+        lines = [line for line in batch if line is not None]
+
+        try:
+            if lines:
+                if log_file is None:
+                    log_file = open(DEBUG_LOG_FILE, 'ab', buffering=1 << 16)
+                log_file.write(b"".join(lines))
+                log_file.flush()
+
+                # Periodically check if log file is too large and truncate if needed
+                writes_since_check += len(lines)
+                if writes_since_check >= LOG_ROTATE_CHECK_INTERVAL:
+                    writes_since_check = 0
+                    if os.fstat(log_file.fileno()).st_size > MAX_LOG_SIZE:
+                        _truncate_log_file()
+        except Exception:
+            pass
+
+        if stopping:
+            if log_file is not None:
+                log_file.close()
+            return
+
+
+def flush_logs():
+    """
+    Write out all queued log lines and stop the writer thread.
+    Runs at interpreter exit, and must be called before os._exit(), which skips
+    atexit handlers. A later log() call starts a new writer.
+    """
+    global _log_writer_thread
+    with _log_writer_lock:
+        writer = _log_writer_thread
+        _log_writer_thread = None
+    if writer is not None:
+        _log_queue.put(None)
+        writer.join(timeout=1)
+
+
+atexit.register(flush_logs)
+
 
 def log(message, category="INFO"):
     """
@@ -14,6 +100,7 @@ def log(message, category="INFO"):
         message: The message to log
         category: Category label (e.g., INFO, ERROR, STEAM, TEMP, etc.)
     """
+    global _log_writer_thread
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     formatted = f"[{timestamp}] [{category}] {message}"
 
@@ -24,18 +111,10 @@ def log(message, category="INFO"):
         # Handle case where console has been freed
         pass
 
-    # Also write to log file
-    try:
-        # Check if log file is too large and truncate if needed
-        if os.path.exists(DEBUG_LOG_FILE):
-            if os.path.getsize(DEBUG_LOG_FILE) > MAX_LOG_SIZE:
-                # Keep last 1000 lines
-                with open(DEBUG_LOG_FILE, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()[-1000:]
-                with open(DEBUG_LOG_FILE, 'w', encoding='utf-8') as f:
-                    f.writelines(lines)
-
-        with open(DEBUG_LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(f"{formatted}\n")
-    except Exception:
-        pass
+    # Also write to log file (via the background writer)
+    if _log_writer_thread is None:
+        with _log_writer_lock:
+            if _log_writer_thread is None:
+                _log_writer_thread = threading.Thread(target=_log_writer, name="vapor-log", daemon=True)
+                _log_writer_thread.start()
+    _log_queue.put(f"{formatted}{os.linesep}".encode('utf-8', 'replace'))
@@ -3,9 +3,25 @@
 
 import os
 import json
+import threading
 from utils.constants import SETTINGS_FILE
 from utils.logging import log
 
+# Fast JSON for the settings file via orjson (falls back to stdlib json).
+# Both paths read and write UTF-8 bytes.
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    _json_loads = json.loads
+
 # =============================================================================
 # Default Settings
 # =============================================================================
@@ -79,30 +95,66 @@ DEFAULT_SETTINGS = {
 # Settings Functions
 # =============================================================================
 
+# Parsed settings and the (mtime_ns, size) of the file they were read from
+_settings_cache = None
+_settings_cache_key = None
+_settings_lock = threading.Lock()
+
+
+def _settings_file_key():
+    """Return (mtime_ns, size) of the settings file, or None if it doesn't exist."""
+    try:
+        st = os.stat(SETTINGS_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_settings():
+    """
+    Return the merged settings dict, re-parsing the file only when it has changed.
+    The returned dict is the shared cache - callers must copy it before mutating.
+    """
+    global _settings_cache, _settings_cache_key
+    file_key = _settings_file_key()
+    if file_key is None:
+        log("Settings file not found, using defaults", "SETTINGS")
+        return DEFAULT_SETTINGS
+
+    with _settings_lock:
+        if file_key == _settings_cache_key:
+            return _settings_cache
+
+    log(f"Loading settings from {SETTINGS_FILE}", "SETTINGS")
+    try:
+        with open(SETTINGS_FILE, 'rb') as f:
+            saved_settings = _json_loads(f.read())
+
+        # Merge with defaults to ensure all keys exist
+        settings = DEFAULT_SETTINGS.copy()
+        settings.update(saved_settings)
+        log("Settings loaded successfully", "SETTINGS")
+    except (ValueError, IOError) as e:
+        log(f"Error loading settings: {e}, using defaults", "SETTINGS")
+        return DEFAULT_SETTINGS
+
+    with _settings_lock:
+        _settings_cache = settings
+        _settings_cache_key = file_key
+    return settings
+
+
 def load_settings():
     """
     Load settings from file or return defaults.
+    The parsed file is cached and only re-read when its mtime or size changes.
+    Lists are copied too, so callers can't mutate the cached settings.
 
     Returns:
         dict: Settings dictionary with all configuration values
     """
-    if os.path.exists(SETTINGS_FILE):
-        log(f"Loading settings from {SETTINGS_FILE}", "SETTINGS")
-        try:
-            with open(SETTINGS_FILE, 'r') as f:
-                saved_settings = json.load(f)
-
-            # Merge with defaults to ensure all keys exist
-            settings = DEFAULT_SETTINGS.copy()
-            settings.update(saved_settings)
-            log("Settings loaded successfully", "SETTINGS")
-            return settings
-        except (json.JSONDecodeError, IOError) as e:
-            log(f"Error loading settings: {e}, using defaults", "SETTINGS")
-            return DEFAULT_SETTINGS.copy()
-    else:
-        log("Settings file not found, using defaults", "SETTINGS")
-        return DEFAULT_SETTINGS.copy()
+    return {key: (value.copy() if isinstance(value, list) else value)
+            for key, value in _read_settings().items()}
 
 
 def save_settings(settings):
@@ -112,12 +164,32 @@ def save_settings(settings):
     Args:
         settings: Dictionary containing all settings
     """
+    global _settings_cache, _settings_cache_key
+    data = _json_dumps(settings)
+    temp_path = SETTINGS_FILE + '.tmp'
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        # Write to a temp file and swap it in, so a crash mid-write (or the other
+        # Vapor process reading concurrently) never sees a truncated file
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        try:
+            os.replace(temp_path, SETTINGS_FILE)
+        except PermissionError:
+            # Windows refuses the swap while another process has the file open
+            with open(SETTINGS_FILE, 'wb') as f:
+                f.write(data)
+            os.remove(temp_path)
         log(f"Settings saved to {SETTINGS_FILE}", "SETTINGS")
     except IOError as e:
         log(f"Error saving settings: {e}", "ERROR")
+        return
+
+    # What was just written is what the next load would parse
+    merged = DEFAULT_SETTINGS.copy()
+    merged.update(settings)
+    with _settings_lock:
+        _settings_cache = merged
+        _settings_cache_key = _settings_file_key()
 
 
 def create_default_settings():
@@ -141,7 +213,7 @@ def get_setting(key, default=None):
     Returns:
         The setting value or default
     """
-    settings = load_settings()
+    settings = _read_settings()
     return settings.get(key, default if default is not None else DEFAULT_SETTINGS.get(key))
 
 
@@ -153,6 +225,16 @@ def set_setting(key, value):
         key: Setting key to update
         value: New value for the setting
     """
+    update_settings({key: value})
+
+
+def update_settings(updates):
+    """
+    Set several setting values with a single write.
+
+    Args:
+        updates: Dictionary of setting keys and their new values
+    """
     settings = load_settings()
-    settings[key] = value
+    settings.update(updates)
     save_settings(settings)
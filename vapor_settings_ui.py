@@ -10,12 +10,27 @@ import sys
 # Single Instance Check
 # =============================================================================
 
+import pywintypes
+import win32con
 import win32event
 import win32api
 import winerror
 
-# Prevent multiple settings windows from opening
-mutex = win32event.CreateMutex(None, True, "Vapor_Settings_SingleInstance_Mutex")
+SETTINGS_MUTEX_NAME = "Vapor_Settings_SingleInstance_Mutex"
+
+# Prevent multiple settings windows from opening. Probe with OpenMutex first so a
+# duplicate launch exits without creating a kernel object of its own.
+try:
+    existing_mutex = win32event.OpenMutex(win32con.SYNCHRONIZE, False, SETTINGS_MUTEX_NAME)
+except pywintypes.error:
+    existing_mutex = None
+if existing_mutex:
+    win32api.CloseHandle(existing_mutex)
+    print("Settings window is already open. Exiting.")
+    sys.exit(0)
+
+# Still check GetLastError - another instance may have won the race since the probe
+mutex = win32event.CreateMutex(None, True, SETTINGS_MUTEX_NAME)
 if win32api.GetLastError() == winerror.ERROR_ALREADY_EXISTS:
     print("Settings window is already open. Exiting.")
     sys.exit(0)